@@ -3,6 +3,9 @@ package bot
 import (
 	"context"
 	"fmt"
+	"os"
+	"path/filepath"
+	"time"
 
 	"github.com/bwmarrin/discordgo"
 	"github.com/vuongmanhnghia/discord-music-bot/internal/commands"
@@ -47,6 +50,21 @@ func New(cfg *config.Config, log *logger.Logger) (*MusicBot, error) {
 	// Set voice encryption mode
 	session.StateEnabled = true
 
+	// Initialize Spotify service (optional) in the background: fetching its token is
+	// a network round trip independent of the database and YouTube setup below
+	var spotifyService *spotify.Service
+	var spotifyErr error
+	spotifyEnabled := cfg.SpotifyClientID != "" && cfg.SpotifyClientSecret != ""
+	spotifyDone := make(chan struct{})
+	if spotifyEnabled {
+		go func() {
+			defer close(spotifyDone)
+			spotifyService, spotifyErr = spotify.NewService(cfg.SpotifyClientID, cfg.SpotifyClientSecret, log)
+		}()
+	} else {
+		close(spotifyDone)
+	}
+
 	// Initialize database if configured
 	var db *database.DB
 	if cfg.UseDatabase {
@@ -64,6 +82,15 @@ func New(cfg *config.Config, log *logger.Logger) (*MusicBot, error) {
 		}
 	}
 
+	// yt-dlp caches the YouTube player code and challenge solver under $XDG_CACHE_HOME;
+	// point every yt-dlp process at the bot's cache dir so they reuse one copy that
+	// survives restarts when the cache dir is mounted, instead of refetching it
+	if os.Getenv("XDG_CACHE_HOME") == "" {
+		if cacheDir, err := filepath.Abs(cfg.CacheDir); err == nil {
+			os.Setenv("XDG_CACHE_HOME", cacheDir)
+		}
+	}
+
 	// Initialize YouTube service
 	ytService, err := youtube.NewService(log)
 	if err != nil {
@@ -72,13 +99,13 @@ func New(cfg *config.Config, log *logger.Logger) (*MusicBot, error) {
 		}
 		return nil, fmt.Errorf("failed to create YouTube service: %w", err)
 	}
+	ytService.SetRequestSleep(time.Duration(cfg.YtDlpSleepRequestsMs) * time.Millisecond)
 
-	// Initialize Spotify service (optional)
-	var spotifyService *spotify.Service
-	if cfg.SpotifyClientID != "" && cfg.SpotifyClientSecret != "" {
-		spotifyService, err = spotify.NewService(cfg.SpotifyClientID, cfg.SpotifyClientSecret, log)
-		if err != nil {
-			log.WithError(err).Warn("Failed to initialize Spotify service - Spotify links will not work")
+	// Wait for the Spotify service started above
+	<-spotifyDone
+	if spotifyEnabled {
+		if spotifyErr != nil {
+			log.WithError(spotifyErr).Warn("Failed to initialize Spotify service - Spotify links will not work")
 		} else {
 			log.Info("Spotify service initialized")
 		}
@@ -158,6 +185,9 @@ func (b *MusicBot) Stop() {
 	// Stop processing service
 	b.processingService.Stop()
 
+	// Stop the YouTube cache cleanup worker now that no workers use the service
+	b.ytService.Close()
+
 	// Cleanup all audio resources
 	b.audioService.CleanupAll()
 
@@ -187,13 +217,16 @@ func (b *MusicBot) onReady(s *discordgo.Session, event *discordgo.Ready) {
 
 // onVoiceStateUpdate handles voice state updates (user joins/leaves voice channels)
 func (b *MusicBot) onVoiceStateUpdate(s *discordgo.Session, event *discordgo.VoiceStateUpdate) {
-	// Skip if 24/7 mode is enabled - never auto-disconnect
-	if b.config.StayConnected247 {
+	// The bot itself left voice: release anything still registered for the guild
+	if event.UserID == s.State.User.ID {
+		if event.ChannelID == "" {
+			b.releaseVoiceResources(event)
+		}
 		return
 	}
 
-	// Skip if the event is about the bot itself
-	if event.UserID == s.State.User.ID {
+	// Skip if 24/7 mode is enabled - never auto-disconnect
+	if b.config.StayConnected247 {
 		return
 	}
 
@@ -251,10 +284,12 @@ func (b *MusicBot) onVoiceStateUpdate(s *discordgo.Session, event *discordgo.Voi
 		}
 	}
 
-	b.logger.WithFields(map[string]interface{}{
-		"guild":     guildID,
-		"userCount": userCount,
-	}).Debug("Voice state update - checking user count")
+	if b.logger.DebugEnabled() {
+		b.logger.WithFields(map[string]interface{}{
+			"guild":     guildID,
+			"userCount": userCount,
+		}).Debug("Voice state update - checking user count")
+	}
 
 	// If no users left in the channel, disconnect
 	if userCount == 0 {
@@ -268,3 +303,27 @@ func (b *MusicBot) onVoiceStateUpdate(s *discordgo.Session, event *discordgo.Voi
 		}
 	}
 }
+
+// releaseVoiceResources drops the audio state of a guild whose voice connection was closed
+// outside the audio service (kicked, channel deleted, or /leave), so stale entries don't linger
+func (b *MusicBot) releaseVoiceResources(event *discordgo.VoiceStateUpdate) {
+	botChannelID := b.audioService.GetVoiceChannelID(event.GuildID)
+	if botChannelID == "" {
+		// Already released
+		return
+	}
+
+	// Ignore leave events for a channel the bot has since moved away from
+	if event.BeforeUpdate != nil && event.BeforeUpdate.ChannelID != botChannelID {
+		return
+	}
+
+	b.logger.WithFields(map[string]interface{}{
+		"guild":   event.GuildID,
+		"channel": botChannelID,
+	}).Info("Voice connection closed externally, releasing audio resources")
+
+	if err := b.audioService.DisconnectFromGuild(event.GuildID); err != nil {
+		b.logger.WithError(err).Warn("Failed to release audio resources")
+	}
+}
@@ -52,12 +52,12 @@ func (h *Handler) handleQueuePagination(s *discordgo.Session, i *discordgo.Inter
 		targetPage = 0
 	case "prev":
 		// Need to find current page from the interaction message
-		targetPage = h.getCurrentPageFromMessage(i)
+		targetPage = getCurrentPageFromMessage(i)
 		if targetPage > 0 {
 			targetPage--
 		}
 	case "next":
-		targetPage = h.getCurrentPageFromMessage(i)
+		targetPage = getCurrentPageFromMessage(i)
 		if targetPage < totalPages-1 {
 			targetPage++
 		}
@@ -89,7 +89,7 @@ func (h *Handler) handleQueuePagination(s *discordgo.Session, i *discordgo.Inter
 }
 
 // getCurrentPageFromMessage extracts current page from the message embed
-func (h *Handler) getCurrentPageFromMessage(i *discordgo.InteractionCreate) int {
+func getCurrentPageFromMessage(i *discordgo.InteractionCreate) int {
 	if len(i.Message.Embeds) == 0 {
 		return 0
 	}
@@ -143,12 +143,12 @@ func (h *Handler) handlePlaylistPagination(s *discordgo.Session, i *discordgo.In
 	case "first":
 		targetPage = 0
 	case "prev":
-		targetPage = h.getCurrentPageFromMessage(i)
+		targetPage = getCurrentPageFromMessage(i)
 		if targetPage > 0 {
 			targetPage--
 		}
 	case "next":
-		targetPage = h.getCurrentPageFromMessage(i)
+		targetPage = getCurrentPageFromMessage(i)
 		if targetPage < totalPages-1 {
 			targetPage++
 		}
@@ -2,6 +2,7 @@ package commands
 
 import (
 	"fmt"
+	"strconv"
 	"strings"
 
 	"github.com/bwmarrin/discordgo"
@@ -10,53 +11,65 @@ import (
 
 const (
 	itemsPerPage = 10
+	// pageLineEstimate is the typical byte length of one rendered song line
+	pageLineEstimate = 80
+	// currentSongMarker follows the position of the song that is playing
+	currentSongMarker = " ►"
+	// compactPaginationPages is the page count up to which only prev/next buttons are shown
+	compactPaginationPages = 3
 )
 
-// PaginationData holds pagination state
-type PaginationData struct {
-	CurrentPage int
-	TotalPages  int
-	TotalItems  int
-	Items       []string
-}
-
 // createPaginationButtons creates navigation buttons for pagination
 func createPaginationButtons(page, totalPages int, customIDPrefix string) []discordgo.MessageComponent {
 	if totalPages <= 1 {
 		return nil
 	}
 
-	buttons := []discordgo.MessageComponent{
-		discordgo.Button{
-			Label:    "⏮️", // First
-			Style:    discordgo.SecondaryButton,
-			CustomID: fmt.Sprintf("%s:first", customIDPrefix),
-			Disabled: page == 0,
-		},
-		discordgo.Button{
-			Label:    "◀️", // Previous
-			Style:    discordgo.PrimaryButton,
-			CustomID: fmt.Sprintf("%s:prev", customIDPrefix),
-			Disabled: page == 0,
-		},
-		discordgo.Button{
-			Label:    fmt.Sprintf("Page %d/%d", page+1, totalPages),
-			Style:    discordgo.SecondaryButton,
-			CustomID: fmt.Sprintf("%s:current:%d", customIDPrefix, page),
-			Disabled: true,
-		},
-		discordgo.Button{
-			Label:    "▶️", // Next
-			Style:    discordgo.PrimaryButton,
-			CustomID: fmt.Sprintf("%s:next", customIDPrefix),
-			Disabled: page >= totalPages-1,
-		},
-		discordgo.Button{
-			Label:    "⏭️", // Last
-			Style:    discordgo.SecondaryButton,
-			CustomID: fmt.Sprintf("%s:last", customIDPrefix),
-			Disabled: page >= totalPages-1,
-		},
+	isFirst := page == 0
+	isLast := page >= totalPages-1
+	prefix := customIDPrefix + ":"
+
+	prev := discordgo.Button{
+		Label:    "◀️", // Previous
+		Style:    discordgo.PrimaryButton,
+		CustomID: prefix + "prev",
+		Disabled: isFirst,
+	}
+	current := discordgo.Button{
+		Label:    fmt.Sprintf("Page %d/%d", page+1, totalPages),
+		Style:    discordgo.SecondaryButton,
+		CustomID: prefix + "current:" + strconv.Itoa(page),
+		Disabled: true,
+	}
+	next := discordgo.Button{
+		Label:    "▶️", // Next
+		Style:    discordgo.PrimaryButton,
+		CustomID: prefix + "next",
+		Disabled: isLast,
+	}
+
+	// First/last jumps add nothing over prev/next when there are only a few pages
+	var buttons []discordgo.MessageComponent
+	if totalPages <= compactPaginationPages {
+		buttons = []discordgo.MessageComponent{prev, current, next}
+	} else {
+		buttons = []discordgo.MessageComponent{
+			discordgo.Button{
+				Label:    "⏮️", // First
+				Style:    discordgo.SecondaryButton,
+				CustomID: prefix + "first",
+				Disabled: isFirst,
+			},
+			prev,
+			current,
+			next,
+			discordgo.Button{
+				Label:    "⏭️", // Last
+				Style:    discordgo.SecondaryButton,
+				CustomID: prefix + "last",
+				Disabled: isLast,
+			},
+		}
 	}
 
 	return []discordgo.MessageComponent{
@@ -68,17 +81,14 @@ func createPaginationButtons(page, totalPages int, customIDPrefix string) []disc
 
 // buildQueuePage builds a paginated queue display
 func buildQueuePage(tracklist *entities.Tracklist, page int) (*discordgo.MessageEmbed, []discordgo.MessageComponent) {
-	if tracklist == nil || tracklist.Size() == 0 {
-		return NewEmbed().
-			Title("Queue").
-			Description("The queue is empty. Use `/play` to add songs!").
-			Color(ColorInfo).
-			Build(), nil
+	if tracklist == nil {
+		return emptyStateEmbed("Queue", "The queue is empty. Use `/play` to add songs!", ""), nil
 	}
 
-	allSongs := tracklist.GetAllSongs()
-	currentPos, _ := tracklist.Position()
-	totalSongs := len(allSongs)
+	currentPos, totalSongs := tracklist.Position()
+	if totalSongs == 0 {
+		return emptyStateEmbed("Queue", "The queue is empty. Use `/play` to add songs!", ""), nil
+	}
 	totalPages := (totalSongs + itemsPerPage - 1) / itemsPerPage
 
 	// Validate page number
@@ -100,34 +110,27 @@ func buildQueuePage(tracklist *entities.Tracklist, page int) (*discordgo.Message
 		end = totalSongs
 	}
 
+	// Copy only the songs shown on this page
+	pageSongs := tracklist.GetRange(start, end)
+	end = start + len(pageSongs)
+
 	// Build song list
 	var sb strings.Builder
-	for i := start; i < end; i++ {
-		song := allSongs[i]
+	sb.Grow(len(pageSongs) * pageLineEstimate)
+	for idx, song := range pageSongs {
 		meta := song.GetMetadata()
 
-		// Position indicator (1-based)
-		position := i + 1
-		indicator := fmt.Sprintf("`%2d.`", position)
-
-		// Highlight current song
+		// Position indicator (1-based), highlighting the current song
+		position := start + idx + 1
+		marker := ""
 		if position == currentPos {
-			indicator = fmt.Sprintf("`%2d.`", position) + " ►"
+			marker = currentSongMarker
 		}
 
 		if meta != nil {
-			title := meta.Title
-			if len(title) > 50 {
-				title = title[:47] + "..."
-			}
-			duration := meta.DurationFormatted()
-			sb.WriteString(fmt.Sprintf("%s **%s** `[%s]`\n", indicator, title, duration))
+			fmt.Fprintf(&sb, "`%2d.`%s **%s** `[%s]`\n", position, marker, song.DisplayTitle(), meta.DurationFormatted())
 		} else {
-			songName := song.DisplayName()
-			if len(songName) > 50 {
-				songName = songName[:47] + "..."
-			}
-			sb.WriteString(fmt.Sprintf("%s **%s**\n", indicator, songName))
+			fmt.Fprintf(&sb, "`%2d.`%s **%s**\n", position, marker, song.DisplayTitle())
 		}
 	}
 
@@ -135,11 +138,9 @@ func buildQueuePage(tracklist *entities.Tracklist, page int) (*discordgo.Message
 
 	// Footer with stats
 	repeatMode := tracklist.GetRepeatMode()
-	repeatIcon := "🔁"
-	if repeatMode == entities.RepeatModeNone {
-		repeatIcon = "➡️"
-	} else if repeatMode == entities.RepeatModeTrack {
-		repeatIcon = "🔂"
+	repeatIcon := repeatModes[repeatMode].icon
+	if repeatIcon == "" {
+		repeatIcon = repeatModes[entities.RepeatModeQueue].icon
 	}
 
 	builder.Footer(fmt.Sprintf("Total: %d songs • Showing %d-%d • Repeat: %s %s",
@@ -154,12 +155,7 @@ func buildQueuePage(tracklist *entities.Tracklist, page int) (*discordgo.Message
 // buildPlaylistPage builds a paginated playlist display
 func buildPlaylistPage(playlistName string, entries []PlaylistEntry, page int) (*discordgo.MessageEmbed, []discordgo.MessageComponent) {
 	if len(entries) == 0 {
-		return NewEmbed().
-			Title(fmt.Sprintf("📋 %s", playlistName)).
-			Description("This playlist is empty").
-			Color(ColorInfo).
-			Footer("Use /playlist add to add songs").
-			Build(), nil
+		return emptyStateEmbed("📋 "+playlistName, "This playlist is empty", "Use /playlist add to add songs"), nil
 	}
 
 	totalItems := len(entries)
@@ -186,6 +182,7 @@ func buildPlaylistPage(playlistName string, entries []PlaylistEntry, page int) (
 
 	// Build song list
 	var sb strings.Builder
+	sb.Grow((end - start) * pageLineEstimate)
 	for i := start; i < end; i++ {
 		entry := entries[i]
 		position := i + 1
@@ -194,11 +191,9 @@ func buildPlaylistPage(playlistName string, entries []PlaylistEntry, page int) (
 		if title == "" {
 			title = entry.OriginalInput
 		}
-		if len(title) > 50 {
-			title = title[:47] + "..."
-		}
+		title = entities.TruncateTitle(title)
 
-		sb.WriteString(fmt.Sprintf("`%2d.` **%s**\n", position, title))
+		fmt.Fprintf(&sb, "`%2d.` **%s**\n", position, title)
 	}
 
 	builder.Description(sb.String())
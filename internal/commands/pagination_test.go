@@ -0,0 +1,62 @@
+package commands
+
+import (
+	"strconv"
+	"testing"
+
+	"github.com/bwmarrin/discordgo"
+	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/entities"
+	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/valueobjects"
+)
+
+func TestCreatePaginationButtons(t *testing.T) {
+	tests := []struct {
+		name       string
+		page       int
+		totalPages int
+		expected   int
+	}{
+		{"Single page has no buttons", 0, 1, 0},
+		{"Two pages are compact", 0, 2, 3},
+		{"Three pages are compact", 1, 3, 3},
+		{"Four pages show first and last", 2, 4, 5},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			components := createPaginationButtons(tt.page, tt.totalPages, "queue")
+			if tt.expected == 0 {
+				if components != nil {
+					t.Errorf("Expected no components, got %d", len(components))
+				}
+				return
+			}
+
+			row, ok := components[0].(discordgo.ActionsRow)
+			if !ok {
+				t.Fatalf("Expected an ActionsRow, got %T", components[0])
+			}
+			if len(row.Components) != tt.expected {
+				t.Errorf("Expected %d buttons, got %d", tt.expected, len(row.Components))
+			}
+		})
+	}
+}
+
+func BenchmarkBuildQueuePage(b *testing.B) {
+	tracklist := entities.NewTracklist("bench-guild")
+	for i := 0; i < 200; i++ {
+		song := entities.NewSong("https://www.youtube.com/watch?v="+strconv.Itoa(i), valueobjects.SourceTypeYouTube, "user", "bench-guild")
+		song.MarkReady(&valueobjects.SongMetadata{Title: "Song " + strconv.Itoa(i), Duration: 180 + i}, "")
+		tracklist.AddSong(song)
+	}
+
+	// Warm up once so first-call costs stay out of the measurement
+	buildQueuePage(tracklist, 5)
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		buildQueuePage(tracklist, i%20)
+	}
+}
@@ -3,6 +3,8 @@ package commands
 import (
 	"fmt"
 	"strings"
+	"sync"
+	"sync/atomic"
 
 	"github.com/bwmarrin/discordgo"
 	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/entities"
@@ -12,6 +14,9 @@ import (
 	"github.com/vuongmanhnghia/discord-music-bot/internal/services/youtube"
 )
 
+// spotifyResolveConcurrency bounds how many Spotify tracks are searched on YouTube at once
+const spotifyResolveConcurrency = 8
+
 // handlePlay handles the play command
 func (h *Handler) handlePlay(s *discordgo.Session, i *discordgo.InteractionCreate) error {
 	if err := deferResponse(s, i); err != nil {
@@ -54,15 +59,7 @@ func (h *Handler) handlePlay(s *discordgo.Session, i *discordgo.InteractionCreat
 	}
 
 	// Add all songs to queue
-	addedCount := 0
-	for _, songInfo := range songs {
-		song := entities.NewSong(songInfo.URL, songInfo.SourceType, i.Member.User.ID, i.GuildID)
-		if err := h.playbackService.AddSong(i.GuildID, song); err != nil {
-			h.logger.WithError(err).Warn("Failed to add song")
-			continue
-		}
-		addedCount++
-	}
+	addedCount := h.playbackService.AddSongs(i.GuildID, newSongs(songs, i.Member.User.ID, i.GuildID))
 
 	if addedCount == 0 {
 		return followUpError(s, i, "Failed to add any songs")
@@ -78,13 +75,9 @@ func (h *Handler) handlePlay(s *discordgo.Session, i *discordgo.InteractionCreat
 	// Build appropriate response
 	var embed *discordgo.MessageEmbed
 	if isPlaylist {
-		embed = NewEmbed().
-			Title("📻 Playlist Added").
-			Description(fmt.Sprintf("Successfully added **%d** songs to the queue", addedCount)).
-			Color(ColorSuccess).
-			Field("Songs Added", fmt.Sprintf("%d", addedCount), true).
-			Footer("Use /queue to view the queue").
-			Build()
+		embed = batchAddedEmbed("📻 Playlist Added",
+			fmt.Sprintf("Successfully added **%d** songs to the queue", addedCount),
+			addedCount, "Use /queue to view the queue")
 	} else {
 		displayTitle := extractedTitle
 		if displayTitle == "" {
@@ -135,15 +128,7 @@ func (h *Handler) handleSpotifyPlaylistPlay(s *discordgo.Session, i *discordgo.I
 	}
 
 	// Add initial songs to queue
-	addedCount := 0
-	for _, songInfo := range initialSongs {
-		song := entities.NewSong(songInfo.URL, songInfo.SourceType, i.Member.User.ID, i.GuildID)
-		if err := h.playbackService.AddSong(i.GuildID, song); err != nil {
-			h.logger.WithError(err).Warn("Failed to add song")
-			continue
-		}
-		addedCount++
-	}
+	addedCount := h.playbackService.AddSongs(i.GuildID, newSongs(initialSongs, i.Member.User.ID, i.GuildID))
 
 	if addedCount == 0 {
 		return followUpError(s, i, "Failed to add any songs to queue")
@@ -235,89 +220,18 @@ func (h *Handler) ResolveSongURLs(query string) ([]SongInfo, bool, error) {
 			return nil, false, fmt.Errorf("no tracks found in Spotify content")
 		}
 
-		// Search YouTube for each Spotify track
+		// Search YouTube once per distinct Spotify track
+		tracks = dedupeSpotifyTracks(tracks)
 		songs := make([]SongInfo, 0, len(tracks))
-		for _, track := range tracks {
-			var videoID string
-			var found bool
-			spotifyDuration := track.GetDurationSeconds()
-
-			// Strategy 1: Try ISRC search first (most accurate)
-			if isrc := track.GetISRC(); isrc != "" {
-				h.logger.WithFields(map[string]interface{}{
-					"track": track.Name,
-					"isrc":  isrc,
-				}).Debug("Trying ISRC search")
-
-				if info, err := h.ytService.SearchByISRC(isrc); err == nil {
-					// Verify duration (±5 seconds tolerance)
-					if absFloat(info.Duration-float64(spotifyDuration)) <= 5 {
-						videoID = info.ID
-						found = true
-						h.logger.WithField("track", track.Name).Info("✅ Found by ISRC with duration match")
-					} else {
-						h.logger.WithFields(map[string]interface{}{
-							"track":            track.Name,
-							"spotify_duration": spotifyDuration,
-							"youtube_duration": info.Duration,
-						}).Warn("ISRC match but duration mismatch, trying other methods")
-					}
-				}
-			}
-
-			// Strategy 2: Try detailed search with album info
-			if !found {
-				detailedQuery := track.ToDetailedSearchQuery()
-				h.logger.WithField("query", detailedQuery).Debug("Trying detailed search")
-
-				results, err := h.ytService.Search(detailedQuery, 3) // Get top 3 results
-				if err == nil && len(results) > 0 {
-					// Find best match by duration
-					bestMatch := findBestDurationMatch(results, spotifyDuration)
-					if bestMatch != nil {
-						videoID = bestMatch.ID
-						found = true
-						h.logger.WithField("track", track.Name).Info("✅ Found by detailed search")
-					}
-				}
-			}
-
-			// Strategy 3: Fall back to simple search
-			if !found {
-				simpleQuery := track.ToSearchQuery()
-				h.logger.WithField("query", simpleQuery).Debug("Trying simple search")
-
-				results, err := h.ytService.Search(simpleQuery, 3)
-				if err != nil {
-					h.logger.WithError(err).WithField("track", track.Name).Warn("All search methods failed")
-					continue
-				}
-
-				if len(results) == 0 {
-					h.logger.WithField("track", track.Name).Warn("No YouTube results found")
-					continue
-				}
-
-				// Find best match by duration
-				bestMatch := findBestDurationMatch(results, spotifyDuration)
-				if bestMatch != nil {
-					videoID = bestMatch.ID
-					found = true
-					h.logger.WithField("track", track.Name).Info("✅ Found by simple search")
-				} else {
-					// Last resort: use first result
-					videoID = results[0].ID
-					h.logger.WithField("track", track.Name).Warn("⚠️ Using first result (no duration match)")
-				}
-			}
-
-			if found || videoID != "" {
-				songs = append(songs, SongInfo{
-					URL:        fmt.Sprintf("https://www.youtube.com/watch?v=%s", videoID),
-					Title:      track.ToSearchQuery(),
-					SourceType: valueobjects.SourceTypeYouTube,
-				})
+		for idx, ytURL := range h.resolveSpotifyTracks(tracks) {
+			if ytURL == "" {
+				continue
 			}
+			songs = append(songs, SongInfo{
+				URL:        ytURL,
+				Title:      tracks[idx].ToSearchQuery(),
+				SourceType: valueobjects.SourceTypeYouTube,
+			})
 		}
 
 		if len(songs) == 0 {
@@ -345,11 +259,15 @@ func (h *Handler) ResolveSongURLs(query string) ([]SongInfo, bool, error) {
 
 			songs := make([]SongInfo, 0, len(videos))
 			for _, video := range videos {
+				if video.ID == "" {
+					continue // Unavailable entries have nothing to play
+				}
+
 				// For SoundCloud, the ID field from yt-dlp contains the full track URL
 				trackURL := video.ID
 				if !strings.HasPrefix(trackURL, "http") {
 					// If ID is not a URL, construct SoundCloud URL
-					trackURL = fmt.Sprintf("https://soundcloud.com/%s", video.ID)
+					trackURL = "https://soundcloud.com/" + video.ID
 				}
 
 				songs = append(songs, SongInfo{
@@ -359,7 +277,7 @@ func (h *Handler) ResolveSongURLs(query string) ([]SongInfo, bool, error) {
 				})
 			}
 
-			return songs, true, nil
+			return dedupeSongs(songs), true, nil
 		}
 
 		// Single SoundCloud track - return the URL directly (yt-dlp will handle it)
@@ -385,14 +303,17 @@ func (h *Handler) ResolveSongURLs(query string) ([]SongInfo, bool, error) {
 
 		songs := make([]SongInfo, 0, len(videos))
 		for _, video := range videos {
+			if video.ID == "" {
+				continue // Unavailable entries have nothing to play
+			}
 			songs = append(songs, SongInfo{
-				URL:        fmt.Sprintf("https://www.youtube.com/watch?v=%s", video.ID),
+				URL:        youtube.VideoURL(video.ID),
 				Title:      video.Title,
 				SourceType: valueobjects.SourceTypeYouTube,
 			})
 		}
 
-		return songs, true, nil
+		return dedupeSongs(songs), true, nil
 	}
 
 	// If query is not a YouTube URL, search for it
@@ -407,7 +328,7 @@ func (h *Handler) ResolveSongURLs(query string) ([]SongInfo, bool, error) {
 		}
 
 		return []SongInfo{{
-			URL:        fmt.Sprintf("https://www.youtube.com/watch?v=%s", results[0].ID),
+			URL:        youtube.VideoURL(results[0].ID),
 			Title:      results[0].Title,
 			SourceType: valueobjects.SourceTypeYouTube,
 		}}, false, nil
@@ -481,7 +402,7 @@ func (h *Handler) handleSkip(s *discordgo.Session, i *discordgo.InteractionCreat
 		nextSong := tracklist.CurrentSong()
 
 		// Build embed with next song info
-		embed := h.buildSkipEmbed(nextSong, fmt.Sprintf("⏭️ Skipped to song #%d", *targetIndex))
+		embed := buildSkipEmbed(nextSong, fmt.Sprintf("⏭️ Skipped to song #%d", *targetIndex))
 		return respondEmbed(s, i, embed)
 	}
 
@@ -493,12 +414,12 @@ func (h *Handler) handleSkip(s *discordgo.Session, i *discordgo.InteractionCreat
 	// Get the next song that will play
 	nextSong := tracklist.CurrentSong()
 
-	embed := h.buildSkipEmbed(nextSong, "⏭️ Skipped to Next")
+	embed := buildSkipEmbed(nextSong, "⏭️ Skipped to Next")
 	return respondEmbed(s, i, embed)
 }
 
 // buildSkipEmbed creates an embed for skip response
-func (h *Handler) buildSkipEmbed(nextSong *entities.Song, title string) *discordgo.MessageEmbed {
+func buildSkipEmbed(nextSong *entities.Song, title string) *discordgo.MessageEmbed {
 	builder := NewEmbed().
 		Title(title).
 		Color(ColorInfo)
@@ -604,12 +525,19 @@ func (h *Handler) resolveSpotifyTrackToYouTube(track spotify.Track) string {
 
 	// Strategy 1: Try ISRC search first (most accurate)
 	if isrc := track.GetISRC(); isrc != "" {
-		h.logger.WithFields(map[string]interface{}{
-			"track": track.Name,
-			"isrc":  isrc,
-		}).Debug("Trying ISRC search")
+		if h.logger.DebugEnabled() {
+			h.logger.WithFields(map[string]interface{}{
+				"track": track.Name,
+				"isrc":  isrc,
+			}).Debug("Trying ISRC search")
+		}
 
-		if info, err := h.ytService.SearchByISRC(isrc); err == nil {
+		info, err := h.ytService.SearchByISRC(isrc)
+		if youtube.IsPermanentError(err) {
+			h.logger.WithError(err).WithField("track", track.Name).Warn("yt-dlp unavailable, skipping remaining search methods")
+			return ""
+		}
+		if err == nil {
 			// Verify duration (±5 seconds tolerance)
 			if absFloat(info.Duration-float64(spotifyDuration)) <= 5 {
 				videoID = info.ID
@@ -628,9 +556,15 @@ func (h *Handler) resolveSpotifyTrackToYouTube(track spotify.Track) string {
 	// Strategy 2: Try detailed search with album info
 	if !found {
 		detailedQuery := track.ToDetailedSearchQuery()
-		h.logger.WithField("query", detailedQuery).Debug("Trying detailed search")
+		if h.logger.DebugEnabled() {
+			h.logger.WithField("query", detailedQuery).Debug("Trying detailed search")
+		}
 
 		results, err := h.ytService.Search(detailedQuery, 3)
+		if youtube.IsPermanentError(err) {
+			h.logger.WithError(err).WithField("track", track.Name).Warn("yt-dlp unavailable, skipping remaining search methods")
+			return ""
+		}
 		if err == nil && len(results) > 0 {
 			bestMatch := findBestDurationMatch(results, spotifyDuration)
 			if bestMatch != nil {
@@ -644,7 +578,9 @@ func (h *Handler) resolveSpotifyTrackToYouTube(track spotify.Track) string {
 	// Strategy 3: Fall back to simple search
 	if !found {
 		simpleQuery := track.ToSearchQuery()
-		h.logger.WithField("query", simpleQuery).Debug("Trying simple search")
+		if h.logger.DebugEnabled() {
+			h.logger.WithField("query", simpleQuery).Debug("Trying simple search")
+		}
 
 		results, err := h.ytService.Search(simpleQuery, 3)
 		if err != nil {
@@ -673,13 +609,79 @@ func (h *Handler) resolveSpotifyTrackToYouTube(track spotify.Track) string {
 		return ""
 	}
 
-	return fmt.Sprintf("https://www.youtube.com/watch?v=%s", videoID)
+	return youtube.VideoURL(videoID)
+}
+
+// newSongs creates a pending queue song for each resolved song
+func newSongs(infos []SongInfo, requestedBy, guildID string) []*entities.Song {
+	songs := make([]*entities.Song, len(infos))
+	for idx, info := range infos {
+		songs[idx] = entities.NewSong(info.URL, info.SourceType, requestedBy, guildID)
+	}
+	return songs
+}
+
+// dedupeSongs drops repeated URLs from a resolved playlist, keeping the first occurrence
+func dedupeSongs(songs []SongInfo) []SongInfo {
+	seen := make(map[string]struct{}, len(songs))
+	unique := songs[:0]
+	for _, song := range songs {
+		if _, ok := seen[song.URL]; ok {
+			continue
+		}
+		seen[song.URL] = struct{}{}
+		unique = append(unique, song)
+	}
+	return unique
+}
+
+// dedupeSpotifyTracks drops repeated tracks, keeping the first occurrence
+func dedupeSpotifyTracks(tracks []spotify.Track) []spotify.Track {
+	seen := make(map[string]struct{}, len(tracks))
+	unique := make([]spotify.Track, 0, len(tracks))
+	for _, track := range tracks {
+		if track.ID != "" {
+			if _, ok := seen[track.ID]; ok {
+				continue
+			}
+			seen[track.ID] = struct{}{}
+		}
+		unique = append(unique, track)
+	}
+	return unique
+}
+
+// resolveSpotifyTracks resolves Spotify tracks to YouTube URLs concurrently
+// Results keep the input order; unresolved tracks are left as empty strings
+func (h *Handler) resolveSpotifyTracks(tracks []spotify.Track) []string {
+	urls := make([]string, len(tracks))
+
+	// A fixed set of workers claims track indexes in turn, rather than one goroutine per track
+	var next atomic.Int64
+	var wg sync.WaitGroup
+	for w := 0; w < min(spotifyResolveConcurrency, len(tracks)); w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for {
+				idx := int(next.Add(1) - 1)
+				if idx >= len(tracks) {
+					return
+				}
+				urls[idx] = h.resolveSpotifyTrackToYouTube(tracks[idx])
+			}
+		}()
+	}
+
+	wg.Wait()
+	return urls
 }
 
 // addSpotifyTracksProgressively resolves Spotify tracks to YouTube progressively
 // Resolves initialCount tracks immediately, then resolves remaining in background
 // Returns: initial songs resolved and total track count
 func (h *Handler) addSpotifyTracksProgressively(guildID, userID string, tracks []spotify.Track, initialCount int) ([]SongInfo, int) {
+	tracks = dedupeSpotifyTracks(tracks)
 	totalTracks := len(tracks)
 	if initialCount <= 0 || initialCount > totalTracks {
 		initialCount = totalTracks
@@ -687,8 +689,7 @@ func (h *Handler) addSpotifyTracksProgressively(guildID, userID string, tracks [
 
 	// Resolve initial batch immediately
 	initialSongs := make([]SongInfo, 0, initialCount)
-	for i := 0; i < initialCount && i < totalTracks; i++ {
-		ytURL := h.resolveSpotifyTrackToYouTube(tracks[i])
+	for i, ytURL := range h.resolveSpotifyTracks(tracks[:initialCount]) {
 		if ytURL != "" {
 			initialSongs = append(initialSongs, SongInfo{
 				URL:        ytURL,
@@ -709,7 +710,8 @@ func (h *Handler) addSpotifyTracksProgressively(guildID, userID string, tracks [
 
 		go func() {
 			addedCount := 0
-			for _, track := range remaining {
+			// Resolve a chunk of tracks concurrently, then queue it in order before the next
+			for start := 0; start < len(remaining); start += spotifyResolveConcurrency {
 				// Check if playback is still active before adding more songs
 				if !h.playbackService.IsPlaying(guildID) {
 					h.logger.WithField("added", addedCount).Info("⏹️ Playback stopped, halting background Spotify track loading")
@@ -722,17 +724,14 @@ func (h *Handler) addSpotifyTracksProgressively(guildID, userID string, tracks [
 					return
 				}
 
-				ytURL := h.resolveSpotifyTrackToYouTube(track)
-				if ytURL == "" {
-					continue
-				}
-
-				song := entities.NewSong(ytURL, valueobjects.SourceTypeYouTube, userID, guildID)
-				if err := h.playbackService.AddSong(guildID, song); err != nil {
-					h.logger.WithError(err).Debug("Failed to add background Spotify song")
-					continue
+				chunk := remaining[start:min(start+spotifyResolveConcurrency, len(remaining))]
+				songs := make([]*entities.Song, 0, len(chunk))
+				for _, ytURL := range h.resolveSpotifyTracks(chunk) {
+					if ytURL != "" {
+						songs = append(songs, entities.NewSong(ytURL, valueobjects.SourceTypeYouTube, userID, guildID))
+					}
 				}
-				addedCount++
+				addedCount += h.playbackService.AddSongs(guildID, songs)
 			}
 			h.logger.WithField("count", addedCount).Info("✅ Finished resolving background Spotify tracks")
 		}()
@@ -0,0 +1,48 @@
+package commands
+
+import (
+	"testing"
+
+	"github.com/vuongmanhnghia/discord-music-bot/internal/services/spotify"
+)
+
+func TestDedupeSongs(t *testing.T) {
+	songs := []SongInfo{
+		{URL: "https://www.youtube.com/watch?v=a", Title: "A"},
+		{URL: "https://www.youtube.com/watch?v=b", Title: "B"},
+		{URL: "https://www.youtube.com/watch?v=a", Title: "A again"},
+		{URL: "https://www.youtube.com/watch?v=c", Title: "C"},
+	}
+
+	unique := dedupeSongs(songs)
+
+	expected := []string{"A", "B", "C"}
+	if len(unique) != len(expected) {
+		t.Fatalf("Expected %d songs, got %d", len(expected), len(unique))
+	}
+	for idx, title := range expected {
+		if unique[idx].Title != title {
+			t.Errorf("Expected song %d to be %s, got %s", idx, title, unique[idx].Title)
+		}
+	}
+}
+
+func TestDedupeSpotifyTracks(t *testing.T) {
+	tracks := []spotify.Track{
+		{ID: "1", Name: "One"},
+		{ID: "2", Name: "Two"},
+		{ID: "1", Name: "One again"},
+		{Name: "Local file"},
+		{Name: "Another local file"},
+	}
+
+	unique := dedupeSpotifyTracks(tracks)
+
+	// Tracks without an ID (local files) can't be compared and are all kept
+	if len(unique) != 4 {
+		t.Fatalf("Expected 4 tracks, got %d", len(unique))
+	}
+	if unique[0].Name != "One" || unique[1].Name != "Two" {
+		t.Errorf("Expected first occurrences to be kept in order, got %s, %s", unique[0].Name, unique[1].Name)
+	}
+}
@@ -20,24 +20,32 @@ func (h *Handler) handlePlaylists(s *discordgo.Session, i *discordgo.Interaction
 	}
 
 	if len(playlists) == 0 {
-		embed := NewEmbed().
-			Title("Playlists").
-			Description("No playlists found.\nUse `/playlist create <name>` to create one!").
-			Color(ColorInfo).
-			Build()
-		return respondEmbed(s, i, embed)
+		return respondEmbed(s, i, emptyStateEmbed("Playlists", "No playlists found.\nUse `/playlist create <name>` to create one!", ""))
 	}
 
+	// Stop once the next line would overflow the description limit instead of
+	// building the whole list and truncating it afterwards
 	var sb strings.Builder
+	shown := 0
 	for _, name := range playlists {
-		sb.WriteString(fmt.Sprintf("⚬ **%s**\n", name))
+		line := "⚬ **" + name + "**\n"
+		if sb.Len()+len(line) > maxEmbedDescription {
+			break
+		}
+		sb.WriteString(line)
+		shown++
+	}
+
+	footer := fmt.Sprintf("%d playlists • Use /use <name> to load a playlist", len(playlists))
+	if shown < len(playlists) {
+		footer = fmt.Sprintf("%d playlists (showing %d) • Use /use <name> to load a playlist", len(playlists), shown)
 	}
 
 	embed := NewEmbed().
 		Title("Available Playlists").
 		Description(sb.String()).
 		Color(ColorPrimary).
-		Footer(fmt.Sprintf("%d playlists • Use /use <name> to load a playlist", len(playlists))).
+		Footer(footer).
 		Build()
 
 	return respondEmbed(s, i, embed)
@@ -93,10 +101,8 @@ func (h *Handler) handleUsePlaylist(s *discordgo.Session, i *discordgo.Interacti
 		return followUpError(s, i, "You must be in a voice channel to play music")
 	}
 
-	songs, err := h.playlistService.GetPlaylistSongsForGuild(guildID, playlistName)
-	if err != nil {
-		return followUpError(s, i, fmt.Sprintf("Failed to load playlist: %v", err))
-	}
+	// Build songs from the playlist already loaded above instead of reading it again
+	songs := playlist.Songs()
 
 	// Stop and clear
 	h.playbackService.Stop(i.GuildID)
@@ -112,12 +118,7 @@ func (h *Handler) handleUsePlaylist(s *discordgo.Session, i *discordgo.Interacti
 	}
 
 	// Add initial songs to queue
-	initialSongs := songs[:initialLoadSize]
-	for _, song := range initialSongs {
-		if err := h.playbackService.AddSong(i.GuildID, song); err != nil {
-			h.logger.WithError(err).Warn("Failed to add song to queue")
-		}
-	}
+	h.playbackService.AddSongs(i.GuildID, songs[:initialLoadSize])
 
 	// Jump to start_index if provided
 	if startIndex != nil {
@@ -239,20 +240,9 @@ func (h *Handler) handleQuickAdd(s *discordgo.Session, i *discordgo.InteractionC
 	}
 
 	// Add all songs to playlist database
-	addedCount := 0
-	for _, songInfo := range songs {
-		err := h.playlistService.AddToPlaylistForGuild(
-			i.GuildID,
-			playlistName,
-			songInfo.URL,
-			songInfo.SourceType,
-			songInfo.Title,
-		)
-		if err != nil {
-			h.logger.WithError(err).Warn("Failed to add song to playlist")
-			continue
-		}
-		addedCount++
+	addedCount, err := h.playlistService.AddManyToPlaylistForGuild(i.GuildID, playlistName, toPlaylistEntries(songs))
+	if err != nil {
+		h.logger.WithError(err).Warn("Failed to add songs to playlist")
 	}
 
 	if addedCount == 0 {
@@ -260,15 +250,7 @@ func (h *Handler) handleQuickAdd(s *discordgo.Session, i *discordgo.InteractionC
 	}
 
 	// Also add songs to playback queue
-	queuedCount := 0
-	for _, songInfo := range songs {
-		song := entities.NewSong(songInfo.URL, songInfo.SourceType, i.Member.User.ID, i.GuildID)
-		if err := h.playbackService.AddSong(i.GuildID, song); err != nil {
-			h.logger.WithError(err).Warn("Failed to add song to playback queue")
-			continue
-		}
-		queuedCount++
-	}
+	queuedCount := h.playbackService.AddSongs(i.GuildID, newSongs(songs, i.Member.User.ID, i.GuildID))
 
 	// Start playback if not already playing
 	if !h.playbackService.IsPlaying(i.GuildID) && queuedCount > 0 {
@@ -282,15 +264,10 @@ func (h *Handler) handleQuickAdd(s *discordgo.Session, i *discordgo.InteractionC
 	if isPlaylist {
 		description := fmt.Sprintf("Added **%d** songs to **%s**", addedCount, playlistName)
 		if queuedCount > 0 {
-			description += fmt.Sprintf("\n🎵 Playing now!")
+			description += "\n🎵 Playing now!"
 		}
-		embed = NewEmbed().
-			Title("✅ Playlist Added").
-			Description(description).
-			Color(ColorSuccess).
-			Field("Songs Added", fmt.Sprintf("%d", addedCount), true).
-			Field("Playlist", playlistName, true).
-			Build()
+		embed = batchAddedEmbed("✅ Playlist Added", description, addedCount, "",
+			&discordgo.MessageEmbedField{Name: "Playlist", Value: playlistName, Inline: true})
 	} else {
 		displayTitle := extractedTitle
 		if displayTitle == "" {
@@ -345,20 +322,8 @@ func (h *Handler) handleQuickAddSpotifyPlaylist(s *discordgo.Session, i *discord
 	}
 
 	// Add all resolved songs to database (initial + background will be added by goroutine)
-	addedToDBCount := 0
-	for _, songInfo := range initialSongs {
-		err := h.playlistService.AddToPlaylistForGuild(
-			i.GuildID,
-			playlistName,
-			songInfo.URL,
-			songInfo.SourceType,
-			songInfo.Title,
-		)
-		if err != nil {
-			h.logger.WithError(err).Warn("Failed to add song to playlist database")
-			continue
-		}
-		addedToDBCount++
+	if _, err := h.playlistService.AddManyToPlaylistForGuild(i.GuildID, playlistName, toPlaylistEntries(initialSongs)); err != nil {
+		h.logger.WithError(err).Warn("Failed to add songs to playlist database")
 	}
 
 	// Background task to add remaining tracks to database as they resolve
@@ -427,56 +392,41 @@ func (h *Handler) handleRemove(s *discordgo.Session, i *discordgo.InteractionCre
 		}
 	}
 
-	// Remove duplicates and collect song titles
-	removedSongs := make([]string, 0, len(indexes))
-	removedCount := 0
-
-	// Remove from highest index to lowest (already sorted descending)
+	// Collect the selected songs, then remove them all with one load and save
+	originalInputs := make([]string, 0, len(indexes))
 	for _, idx := range indexes {
-		if idx < 1 || idx > len(playlist.Entries) {
-			// Skip if already removed (in case of duplicates after other removals)
-			continue
-		}
+		originalInputs = append(originalInputs, playlist.Entries[idx-1].OriginalInput)
+	}
 
-		songTitle := playlist.Entries[idx-1].Title
-		if songTitle == "" {
-			songTitle = playlist.Entries[idx-1].OriginalInput
-		}
+	removed, err := h.playlistService.RemoveManyFromPlaylistForGuild(guildID, playlistName, originalInputs)
+	if err != nil {
+		h.logger.WithError(err).Warn("Failed to remove songs from playlist")
+		return respondError(s, i, "Failed to remove any songs")
+	}
 
-		originalInput := playlist.Entries[idx-1].OriginalInput
-		if err := h.playlistService.RemoveFromPlaylistForGuild(guildID, playlistName, originalInput); err != nil {
-			h.logger.WithError(err).Warn("Failed to remove song from playlist")
-			continue
+	// Describe only what was actually removed; the playlist may have changed since it was read
+	removedSongs := make([]string, 0, len(removed))
+	for _, entry := range removed {
+		songTitle := entry.Title
+		if songTitle == "" {
+			songTitle = entry.OriginalInput
 		}
-
 		removedSongs = append(removedSongs, songTitle)
-		removedCount++
-
-		// Reload playlist after each removal to keep indexes accurate
-		playlist, err = h.playlistService.GetPlaylistForGuild(guildID, playlistName)
-		if err != nil {
-			break
-		}
-	}
-
-	if removedCount == 0 {
-		return respondError(s, i, "Failed to remove any songs")
 	}
 
 	// Build response
 	var description string
-	if removedCount == 1 {
+	if len(removedSongs) == 1 {
 		description = fmt.Sprintf("Removed **%s** from **%s**", removedSongs[0], playlistName)
 	} else {
 		// Show first 5 songs, then "and X more"
 		displayCount := 5
+		description = fmt.Sprintf("Removed **%d songs** from **%s**:\n", len(removedSongs), playlistName)
 		if len(removedSongs) <= displayCount {
-			description = fmt.Sprintf("Removed **%d songs** from **%s**:\n", removedCount, playlistName)
 			for _, song := range removedSongs {
 				description += fmt.Sprintf("• %s\n", song)
 			}
 		} else {
-			description = fmt.Sprintf("Removed **%d songs** from **%s**:\n", removedCount, playlistName)
 			for i := 0; i < displayCount; i++ {
 				description += fmt.Sprintf("• %s\n", removedSongs[i])
 			}
@@ -617,20 +567,9 @@ func (h *Handler) handlePlaylistAdd(s *discordgo.Session, i *discordgo.Interacti
 		}
 
 		// Add all songs to playlist
-		addedCount := 0
-		for _, songInfo := range songs {
-			err := h.playlistService.AddToPlaylistForGuild(
-				guildID,
-				name,
-				songInfo.URL,
-				songInfo.SourceType,
-				songInfo.Title,
-			)
-			if err != nil {
-				h.logger.WithError(err).Warn("Failed to add song to playlist")
-				continue
-			}
-			addedCount++
+		addedCount, err := h.playlistService.AddManyToPlaylistForGuild(guildID, name, toPlaylistEntries(songs))
+		if err != nil {
+			h.logger.WithError(err).Warn("Failed to add songs to playlist")
 		}
 
 		if addedCount == 0 {
@@ -640,12 +579,9 @@ func (h *Handler) handlePlaylistAdd(s *discordgo.Session, i *discordgo.Interacti
 		// Build appropriate response
 		var embed *discordgo.MessageEmbed
 		if isPlaylist {
-			embed = NewEmbed().
-				Title("✅ Playlist Added").
-				Description(fmt.Sprintf("Added **%d** songs to playlist **%s**", addedCount, name)).
-				Color(ColorSuccess).
-				Field("Songs Added", fmt.Sprintf("%d", addedCount), true).
-				Build()
+			embed = batchAddedEmbed("✅ Playlist Added",
+				fmt.Sprintf("Added **%d** songs to playlist **%s**", addedCount, name),
+				addedCount, "")
 		} else {
 			displayTitle := extractedTitle
 			if displayTitle == "" {
@@ -793,3 +729,16 @@ func parseIndexes(input string) ([]int, error) {
 
 	return indexes, nil
 }
+
+// toPlaylistEntries converts resolved songs into playlist entries for a bulk add
+func toPlaylistEntries(songs []SongInfo) []entities.PlaylistEntry {
+	entries := make([]entities.PlaylistEntry, len(songs))
+	for idx, song := range songs {
+		entries[idx] = entities.PlaylistEntry{
+			OriginalInput: song.URL,
+			SourceType:    song.SourceType,
+			Title:         song.Title,
+		}
+	}
+	return entries
+}
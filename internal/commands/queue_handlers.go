@@ -1,7 +1,6 @@
 package commands
 
 import (
-	"context"
 	"fmt"
 	"time"
 
@@ -41,23 +40,27 @@ func (h *Handler) handleNowPlaying(s *discordgo.Session, i *discordgo.Interactio
 
 	metadata := current.GetMetadata()
 
-	builder := NewEmbed().
-		Title("Now Playing").
-		Description(fmt.Sprintf("**%s**", metadata.Title)).
-		Color(ColorPrimary).
-		Thumbnail(metadata.Thumbnail).
-		Field("Duration", metadata.DurationFormatted(), true)
-
+	fields := make([]*discordgo.MessageEmbedField, 0, 3)
+	fields = append(fields, &discordgo.MessageEmbedField{Name: "Duration", Value: metadata.DurationFormatted(), Inline: true})
 	if metadata.Uploader != "" {
-		builder.Field("Artist", metadata.Uploader, true)
+		fields = append(fields, &discordgo.MessageEmbedField{Name: "Artist", Value: metadata.Uploader, Inline: true})
 	}
 
 	// Add progress indicator
-	builder.Field("Status", "Playing", true)
-
-	builder.Footer("Use /skip to play next song")
+	fields = append(fields, &discordgo.MessageEmbedField{Name: "Status", Value: "Playing", Inline: true})
+
+	embed := &discordgo.MessageEmbed{
+		Title:       "Now Playing",
+		Description: "**" + metadata.Title + "**",
+		Color:       ColorPrimary,
+		Fields:      fields,
+		Footer:      &discordgo.MessageEmbedFooter{Text: "Use /skip to play next song"},
+	}
+	if metadata.Thumbnail != "" {
+		embed.Thumbnail = &discordgo.MessageEmbedThumbnail{URL: metadata.Thumbnail}
+	}
 
-	return respondEmbed(s, i, builder.Build())
+	return respondEmbed(s, i, embed)
 }
 
 // handleShuffle handles the shuffle command
@@ -113,12 +116,10 @@ func (h *Handler) handleClear(s *discordgo.Session, i *discordgo.InteractionCrea
 	// 5. Clear YouTube cache
 	h.ytService.ClearCache()
 
-	// 6. Leave voice channel to fully disconnect
+	// 6. Leave voice channel to fully disconnect (in background, the reply doesn't depend on it)
 	voiceConnections := s.VoiceConnections
 	if vc, exists := voiceConnections[i.GuildID]; exists && vc != nil {
-		if err := vc.Disconnect(context.Background()); err != nil {
-			h.logger.WithError(err).Warn("Failed to disconnect from voice channel")
-		}
+		go h.disconnectVoice(vc)
 	}
 
 	h.logger.Info("✅ FULL reset completed (all workers stopped and restarted)")
@@ -138,6 +139,19 @@ func (h *Handler) handleClear(s *discordgo.Session, i *discordgo.InteractionCrea
 	return respondEmbed(s, i, embed)
 }
 
+// repeatModeInfo holds the display text and icon for a repeat mode
+type repeatModeInfo struct {
+	display string
+	icon    string
+}
+
+// repeatModes maps each repeat mode to its display info
+var repeatModes = map[entities.RepeatMode]repeatModeInfo{
+	entities.RepeatModeNone:  {display: "Off", icon: "➡️"},
+	entities.RepeatModeTrack: {display: "Single Track", icon: "🔂"},
+	entities.RepeatModeQueue: {display: "Entire Queue", icon: "🔁"},
+}
+
 // handleRepeat handles the repeat command
 func (h *Handler) handleRepeat(s *discordgo.Session, i *discordgo.InteractionCreate) error {
 	tracklist := h.playbackService.GetTracklist(i.GuildID)
@@ -148,32 +162,16 @@ func (h *Handler) handleRepeat(s *discordgo.Session, i *discordgo.InteractionCre
 	options := i.ApplicationCommandData().Options
 	modeStr := options[0].StringValue()
 
-	var mode entities.RepeatMode
-	var modeDisplay string
-	var modeIcon string
-
-	switch modeStr {
-	case "none":
-		mode = entities.RepeatModeNone
-		modeDisplay = "Off"
-		modeIcon = "➡️"
-	case "track":
-		mode = entities.RepeatModeTrack
-		modeDisplay = "Single Track"
-		modeIcon = "🔂"
-	case "queue":
-		mode = entities.RepeatModeQueue
-		modeDisplay = "Entire Queue"
-		modeIcon = "🔁"
-	default:
+	info, ok := repeatModes[entities.RepeatMode(modeStr)]
+	if !ok {
 		return respondError(s, i, "Invalid repeat mode")
 	}
 
-	tracklist.SetRepeatMode(mode)
+	tracklist.SetRepeatMode(entities.RepeatMode(modeStr))
 
 	embed := NewEmbed().
-		Title(fmt.Sprintf("%s Repeat Mode Updated", modeIcon)).
-		Description(fmt.Sprintf("Repeat mode set to: **%s**", modeDisplay)).
+		Title(fmt.Sprintf("%s Repeat Mode Updated", info.icon)).
+		Description(fmt.Sprintf("Repeat mode set to: **%s**", info.display)).
 		Color(ColorInfo).
 		Build()
 
@@ -1,6 +1,10 @@
 package commands
 
 import (
+	"strconv"
+	"sync"
+	"time"
+
 	"github.com/bwmarrin/discordgo"
 )
 
@@ -13,6 +17,13 @@ const (
 	ColorInfo    = 0x3498DB // Blue
 )
 
+const (
+	// maxEmbedDescription is Discord's character limit for an embed description
+	maxEmbedDescription = 4096
+	// embedFieldsCap covers the field count of every embed the bot builds field by field
+	embedFieldsCap = 4
+)
+
 // respond sends a simple text response
 func respond(s *discordgo.Session, i *discordgo.InteractionCreate, message string) error {
 	return s.InteractionRespond(i.Interaction, &discordgo.InteractionResponse{
@@ -111,6 +122,62 @@ func followUpSuccess(s *discordgo.Session, i *discordgo.InteractionCreate, messa
 	return followUpEmbed(s, i, embed)
 }
 
+// emptyStateEmbed builds the info embed shown when a list has nothing to display
+func emptyStateEmbed(title, description, footer string) *discordgo.MessageEmbed {
+	embed := &discordgo.MessageEmbed{
+		Title:       title,
+		Description: description,
+		Color:       ColorInfo,
+	}
+	if footer != "" {
+		embed.Footer = &discordgo.MessageEmbedFooter{Text: footer}
+	}
+	return embed
+}
+
+// batchAddedEmbed builds the success embed shown after adding several songs at once
+func batchAddedEmbed(title, description string, addedCount int, footer string, extra ...*discordgo.MessageEmbedField) *discordgo.MessageEmbed {
+	fields := make([]*discordgo.MessageEmbedField, 0, 1+len(extra))
+	fields = append(fields, &discordgo.MessageEmbedField{
+		Name:   "Songs Added",
+		Value:  strconv.Itoa(addedCount),
+		Inline: true,
+	})
+	fields = append(fields, extra...)
+
+	embed := &discordgo.MessageEmbed{
+		Title:       title,
+		Description: description,
+		Color:       ColorSuccess,
+		Fields:      fields,
+	}
+	if footer != "" {
+		embed.Footer = &discordgo.MessageEmbedFooter{Text: footer}
+	}
+	return embed
+}
+
+// lastTimestamp caches the embed timestamp string for the most recent second
+var lastTimestamp struct {
+	sync.Mutex
+	unix int64
+	text string
+}
+
+// nowTimestamp returns the current time in RFC3339, formatting at most once per second
+func nowTimestamp() string {
+	now := time.Now()
+
+	lastTimestamp.Lock()
+	defer lastTimestamp.Unlock()
+
+	if unix := now.Unix(); unix != lastTimestamp.unix {
+		lastTimestamp.unix = unix
+		lastTimestamp.text = now.Format(time.RFC3339)
+	}
+	return lastTimestamp.text
+}
+
 // EmbedBuilder helps build consistent embeds
 type EmbedBuilder struct {
 	embed *discordgo.MessageEmbed
@@ -145,6 +212,9 @@ func (b *EmbedBuilder) Color(color int) *EmbedBuilder {
 
 // Field adds a field to the embed
 func (b *EmbedBuilder) Field(name, value string, inline bool) *EmbedBuilder {
+	if b.embed.Fields == nil {
+		b.embed.Fields = make([]*discordgo.MessageEmbedField, 0, embedFieldsCap)
+	}
 	b.embed.Fields = append(b.embed.Fields, &discordgo.MessageEmbedField{
 		Name:   name,
 		Value:  value,
@@ -153,6 +223,12 @@ func (b *EmbedBuilder) Field(name, value string, inline bool) *EmbedBuilder {
 	return b
 }
 
+// Fields adds several fields to the embed with a single slice growth
+func (b *EmbedBuilder) Fields(fields ...*discordgo.MessageEmbedField) *EmbedBuilder {
+	b.embed.Fields = append(b.embed.Fields, fields...)
+	return b
+}
+
 // Thumbnail sets the thumbnail URL
 func (b *EmbedBuilder) Thumbnail(url string) *EmbedBuilder {
 	if url != "" {
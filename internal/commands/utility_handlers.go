@@ -2,8 +2,7 @@ package commands
 
 import (
 	"context"
-	"fmt"
-	"time"
+	"strconv"
 
 	"github.com/bwmarrin/discordgo"
 )
@@ -50,26 +49,31 @@ func (h *Handler) handleLeave(s *discordgo.Session, i *discordgo.InteractionCrea
 	delete(h.activePlaylist, i.GuildID)
 	h.activePlaylistMu.Unlock()
 
-	// Disconnect from voice
+	// Disconnect from voice after acknowledging, so the reply doesn't wait on the voice gateway
 	for _, vs := range s.VoiceConnections {
 		if vs.GuildID == i.GuildID {
-			if err := vs.Disconnect(context.Background()); err != nil {
-				return respondError(s, i, "Failed to disconnect from voice channel")
-			}
-
 			embed := NewEmbed().
 				Title("👋 Disconnected").
 				Description("Left the voice channel and cleared all playback state").
 				Color(ColorInfo).
 				Build()
 
-			return respondEmbed(s, i, embed)
+			err := respondEmbed(s, i, embed)
+			go h.disconnectVoice(vs)
+			return err
 		}
 	}
 
 	return respondError(s, i, "I'm not currently in a voice channel")
 }
 
+// disconnectVoice closes a voice connection, logging any failure
+func (h *Handler) disconnectVoice(vc *discordgo.VoiceConnection) {
+	if err := vc.Disconnect(context.Background()); err != nil {
+		h.logger.WithError(err).WithField("guild", vc.GuildID).Warn("Failed to disconnect from voice channel")
+	}
+}
+
 // handleStats handles the stats command
 func (h *Handler) handleStats(s *discordgo.Session, i *discordgo.InteractionCreate) error {
 	voiceCount := len(s.VoiceConnections)
@@ -84,57 +88,72 @@ func (h *Handler) handleStats(s *discordgo.Session, i *discordgo.InteractionCrea
 		latencyStatus = "🟡 Moderate"
 	}
 
-	embed := NewEmbed().
-		Title("Bot Statistics").
-		Color(ColorPrimary).
-		Field("Servers", fmt.Sprintf("%d", guildCount), true).
-		Field("Active Sessions", fmt.Sprintf("%d", voiceCount), true).
-		Field("Latency", fmt.Sprintf("%dms %s", latency, latencyStatus), true).
-		Footer(h.config.BotName).
-		Timestamp(time.Now().Format(time.RFC3339)).
-		Build()
+	// Status embed has a fixed shape, so build it in one literal
+	embed := &discordgo.MessageEmbed{
+		Title: "Bot Statistics",
+		Color: ColorPrimary,
+		Fields: []*discordgo.MessageEmbedField{
+			{Name: "Servers", Value: strconv.Itoa(guildCount), Inline: true},
+			{Name: "Active Sessions", Value: strconv.Itoa(voiceCount), Inline: true},
+			{Name: "Latency", Value: strconv.FormatInt(latency, 10) + "ms " + latencyStatus, Inline: true},
+		},
+		Footer:    &discordgo.MessageEmbedFooter{Text: h.config.BotName},
+		Timestamp: nowTimestamp(),
+	}
 
 	return respondEmbed(s, i, embed)
 }
 
+// helpFooter is the footer shown on the help embed
+const helpFooter = "Discord Music Bot v2.0.0 • Built with Go"
+
+// helpFields are the static sections of the help embed, built once at startup
+var helpFields = []*discordgo.MessageEmbedField{
+	{
+		Name: "Basic",
+		Value: "> **`/join` - Join voice channel**\n" +
+			"> **`/leave` - Leave and clear state**\n",
+	},
+	{
+		Name: "Playback",
+		Value: "> **`/play <query>` - Play a song**\n" +
+			"> **`/pause` - Pause playback**\n" +
+			"> **`/resume` - Resume playback**\n" +
+			"> **`/skip` - Skip current song**\n" +
+			"> **`/stop` - Stop and clear queue**\n" +
+			"> **`/volume <0-100>` - Adjust volume**",
+	},
+	{
+		Name: "Queue Management",
+		Value: "> **`/queue` - View current queue**\n" +
+			"> **`/nowplaying` - Current song info**\n" +
+			"> **`/shuffle` - Shuffle queue**\n" +
+			"> **`/clear` - Clear queue & reset**\n" +
+			"> **`/repeat <mode>` - Set repeat mode**",
+	},
+	{
+		Name: "Playlist Management",
+		Value: "> **`/playlists` - List all playlists**\n" +
+			"> **`/use <name> <start_index>` - Load a playlist**\n" +
+			"> **`/add <song>` - Quick add to active playlist**\n" +
+			"> **`/playlist create/delete/show/add/rename`**\n" +
+			"> **`/remove <playlist> <indexes>` - Remove songs**",
+	},
+	{
+		Name: "Utility",
+		Value: "> **`/stats` - Bot statistics**\n" +
+			"> **`/help` - Show this help**\n" +
+			"> **`/sync` - [Admin] Sync commands**",
+	},
+}
+
 // handleHelp handles the help command
 func (h *Handler) handleHelp(s *discordgo.Session, i *discordgo.InteractionCreate) error {
 	embed := NewEmbed().
 		Title(h.config.BotName).
-		Description("").
 		Color(ColorPrimary).
-		Field("Basic",
-			"> **`/join` - Join voice channel**\n"+
-				"> **`/leave` - Leave and clear state**\n",
-			false).
-		Field("Playback",
-			"> **`/play <query>` - Play a song**\n"+
-				"> **`/pause` - Pause playback**\n"+
-				"> **`/resume` - Resume playback**\n"+
-				"> **`/skip` - Skip current song**\n"+
-				"> **`/stop` - Stop and clear queue**\n"+
-				"> **`/volume <0-100>` - Adjust volume**",
-			false).
-		Field("Queue Management",
-			"> **`/queue` - View current queue**\n"+
-				"> **`/nowplaying` - Current song info**\n"+
-				"> **`/shuffle` - Shuffle queue**\n"+
-				"> **`/clear` - Clear queue & reset**\n"+
-				"> **`/repeat <mode>` - Set repeat mode**",
-			false).
-		Field("Playlist Management",
-			"> **`/playlists` - List all playlists**\n"+
-				"> **`/use <name> <start_index>` - Load a playlist**\n"+
-				"> **`/add <song>` - Quick add to active playlist**\n"+
-				"> **`/playlist create/delete/show/add/rename`**\n"+
-				"> **`/remove <playlist> <indexes>` - Remove songs**",
-			false).
-		Field("Utility",
-			"> **`/stats` - Bot statistics**\n"+
-				"> **`/help` - Show this help**\n"+
-				"> **`/sync` - [Admin] Sync commands**",
-			false).
-		Footer("Discord Music Bot v2.0.0 • Built with Go").
+		Fields(helpFields...).
+		Footer(helpFooter).
 		Build()
 
 	return respondEmbed(s, i, embed)
@@ -39,6 +39,7 @@ type Config struct {
 	CacheSizeMB          int
 	CacheDurationMinutes int
 	InitialLoadSize      int
+	YtDlpSleepRequestsMs int // pause between yt-dlp requests on bulk extractions, 0 disables
 }
 
 // Load reads configuration from environment variables
@@ -100,6 +101,7 @@ func Load() (*Config, error) {
 		CacheSizeMB:          getEnvInt("CACHE_SIZE_MB", 100),
 		CacheDurationMinutes: getEnvInt("CACHE_DURATION_MINUTES", 360),
 		InitialLoadSize:      getEnvInt("INITIAL_LOAD_SIZE", 5),
+		YtDlpSleepRequestsMs: getEnvInt("YTDLP_SLEEP_REQUESTS_MS", 0),
 	}
 
 	// Validate configuration
@@ -195,5 +197,10 @@ func (c *Config) Validate() error {
 		return fmt.Errorf("initial load size must be at least 1, got %d", c.InitialLoadSize)
 	}
 
+	// yt-dlp request pause validation
+	if c.YtDlpSleepRequestsMs < 0 {
+		return fmt.Errorf("yt-dlp request sleep cannot be negative, got %d", c.YtDlpSleepRequestsMs)
+	}
+
 	return nil
 }
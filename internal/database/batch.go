@@ -0,0 +1,34 @@
+package database
+
+import (
+	"context"
+	"fmt"
+
+	"github.com/jackc/pgx/v5"
+)
+
+// AddPlaylistEntries inserts entries in order, sending every insert in a single round trip.
+// Each insert still appends at MAX(position)+1, so positions match one-by-one AddPlaylistEntry calls.
+func AddPlaylistEntries(ctx context.Context, tx pgx.Tx, entries []AddPlaylistEntryParams) error {
+	if len(entries) == 0 {
+		return nil
+	}
+
+	batch := &pgx.Batch{}
+	for _, arg := range entries {
+		batch.Queue(addPlaylistEntry,
+			arg.PlaylistID,
+			arg.OriginalInput,
+			arg.SourceType,
+			arg.Title,
+			arg.DurationSeconds,
+			arg.ThumbnailUrl,
+			arg.AddedBy,
+		)
+	}
+
+	if err := tx.SendBatch(ctx, batch).Close(); err != nil {
+		return fmt.Errorf("failed to add playlist entries: %w", err)
+	}
+	return nil
+}
@@ -12,6 +12,16 @@ type FlexTime struct {
 	time.Time
 }
 
+// flexTimeFormats are the layouts FlexTime accepts, tried in order
+var flexTimeFormats = []string{
+	time.RFC3339,                 // Standard Go format
+	time.RFC3339Nano,             // Go with nanoseconds
+	"2006-01-02T15:04:05.999999", // Python datetime without timezone
+	"2006-01-02T15:04:05",        // Python datetime without microseconds
+	"2006-01-02 15:04:05.999999", // Alternative format
+	"2006-01-02 15:04:05",        // Simple datetime
+}
+
 // UnmarshalJSON handles multiple time formats (Python and Go)
 func (ft *FlexTime) UnmarshalJSON(b []byte) error {
 	var s string
@@ -19,17 +29,7 @@ func (ft *FlexTime) UnmarshalJSON(b []byte) error {
 		return err
 	}
 
-	// Try different formats
-	formats := []string{
-		time.RFC3339,                 // Standard Go format
-		time.RFC3339Nano,             // Go with nanoseconds
-		"2006-01-02T15:04:05.999999", // Python datetime without timezone
-		"2006-01-02T15:04:05",        // Python datetime without microseconds
-		"2006-01-02 15:04:05.999999", // Alternative format
-		"2006-01-02 15:04:05",        // Simple datetime
-	}
-
-	for _, format := range formats {
+	for _, format := range flexTimeFormats {
 		if t, err := time.Parse(format, s); err == nil {
 			ft.Time = t
 			return nil
@@ -43,7 +43,11 @@ func (ft *FlexTime) UnmarshalJSON(b []byte) error {
 
 // MarshalJSON outputs in RFC3339 format
 func (ft FlexTime) MarshalJSON() ([]byte, error) {
-	return json.Marshal(ft.Time.Format(time.RFC3339))
+	// RFC3339 output never needs escaping, so quote it directly
+	b := make([]byte, 0, len(time.RFC3339)+8)
+	b = append(b, '"')
+	b = ft.Time.AppendFormat(b, time.RFC3339)
+	return append(b, '"'), nil
 }
 
 // PlaylistEntry represents a single entry in a playlist
@@ -97,6 +101,34 @@ func (p *Playlist) RemoveEntry(originalInput string) bool {
 	return false
 }
 
+// RemoveEntries removes the first occurrence of each given original input in a single pass
+// and returns the removed entries in playlist order
+func (p *Playlist) RemoveEntries(originalInputs []string) []*PlaylistEntry {
+	pending := make(map[string]int, len(originalInputs))
+	for _, input := range originalInputs {
+		pending[input]++
+	}
+
+	var removed []*PlaylistEntry
+	kept := p.Entries[:0]
+	for _, entry := range p.Entries {
+		if pending[entry.OriginalInput] > 0 {
+			pending[entry.OriginalInput]--
+			removed = append(removed, entry)
+			continue
+		}
+		kept = append(kept, entry)
+	}
+
+	// Clear the vacated tail so the slice no longer references removed entries
+	clear(p.Entries[len(kept):])
+	p.Entries = kept
+	if len(removed) > 0 {
+		p.UpdatedAt = FlexTime{time.Now()}
+	}
+	return removed
+}
+
 // HasEntry checks if an entry exists
 func (p *Playlist) HasEntry(originalInput string) bool {
 	for _, entry := range p.Entries {
@@ -107,6 +139,23 @@ func (p *Playlist) HasEntry(originalInput string) bool {
 	return false
 }
 
+// Songs creates a pending Song for every entry, pre-titled from the playlist
+func (p *Playlist) Songs() []*Song {
+	songs := make([]*Song, 0, len(p.Entries))
+	for _, entry := range p.Entries {
+		song := NewSong(entry.OriginalInput, entry.SourceType, "", "")
+		// Pre-set metadata with title from playlist (won't be ready until processed)
+		song.Metadata = &valueobjects.SongMetadata{
+			Title: entry.Title,
+		}
+		if entry.Title != "" {
+			song.displayTitle = TruncateTitle(entry.Title)
+		}
+		songs = append(songs, song)
+	}
+	return songs
+}
+
 // TotalSongs returns the number of songs in the playlist
 func (p *Playlist) TotalSongs() int {
 	return len(p.Entries)
@@ -0,0 +1,103 @@
+package entities_test
+
+import (
+	"encoding/json"
+	"testing"
+	"time"
+
+	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/entities"
+	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/valueobjects"
+)
+
+func TestFlexTimeUnmarshalFormats(t *testing.T) {
+	tests := []struct {
+		name     string
+		input    string
+		expected time.Time
+	}{
+		{"RFC3339", `"2024-05-01T10:20:30Z"`, time.Date(2024, 5, 1, 10, 20, 30, 0, time.UTC)},
+		{"RFC3339 nano", `"2024-05-01T10:20:30.5Z"`, time.Date(2024, 5, 1, 10, 20, 30, 500000000, time.UTC)},
+		{"Python microseconds", `"2024-05-01T10:20:30.123456"`, time.Date(2024, 5, 1, 10, 20, 30, 123456000, time.UTC)},
+		{"Python seconds", `"2024-05-01T10:20:30"`, time.Date(2024, 5, 1, 10, 20, 30, 0, time.UTC)},
+		{"Space separated", `"2024-05-01 10:20:30"`, time.Date(2024, 5, 1, 10, 20, 30, 0, time.UTC)},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var ft entities.FlexTime
+			if err := json.Unmarshal([]byte(tt.input), &ft); err != nil {
+				t.Fatalf("Unmarshal(%s) returned error: %v", tt.input, err)
+			}
+			if !ft.Time.Equal(tt.expected) {
+				t.Errorf("Unmarshal(%s) = %v, expected %v", tt.input, ft.Time, tt.expected)
+			}
+		})
+	}
+}
+
+func TestFlexTimeMarshalRoundTrip(t *testing.T) {
+	original := entities.FlexTime{Time: time.Date(2024, 5, 1, 10, 20, 30, 0, time.UTC)}
+
+	data, err := json.Marshal(original)
+	if err != nil {
+		t.Fatalf("Marshal returned error: %v", err)
+	}
+
+	if string(data) != `"2024-05-01T10:20:30Z"` {
+		t.Errorf("Expected RFC3339 output, got %s", data)
+	}
+
+	var decoded entities.FlexTime
+	if err := json.Unmarshal(data, &decoded); err != nil {
+		t.Fatalf("Unmarshal returned error: %v", err)
+	}
+
+	if !decoded.Time.Equal(original.Time) {
+		t.Errorf("Round trip mismatch: got %v, expected %v", decoded.Time, original.Time)
+	}
+}
+
+func TestPlaylistSongs(t *testing.T) {
+	playlist := entities.NewPlaylist("test")
+	playlist.AddEntry("https://www.youtube.com/watch?v=1", valueobjects.SourceTypeYouTube, "First Song")
+	playlist.AddEntry("https://www.youtube.com/watch?v=2", valueobjects.SourceTypeYouTube, "")
+
+	songs := playlist.Songs()
+	if len(songs) != 2 {
+		t.Fatalf("Expected 2 songs, got %d", len(songs))
+	}
+
+	if songs[0].DisplayTitle() != "First Song" {
+		t.Errorf("Expected display title from playlist entry, got %s", songs[0].DisplayTitle())
+	}
+
+	if songs[1].DisplayTitle() != "https://www.youtube.com/watch?v=2" {
+		t.Errorf("Expected untitled entry to fall back to its input, got %s", songs[1].DisplayTitle())
+	}
+
+	if songs[0].GetStatus() != valueobjects.SongStatusPending {
+		t.Errorf("Expected pending status, got %s", songs[0].GetStatus())
+	}
+}
+
+func TestPlaylistRemoveEntries(t *testing.T) {
+	playlist := entities.NewPlaylist("test")
+	for _, input := range []string{"a", "b", "a", "c"} {
+		playlist.AddEntry(input, valueobjects.SourceTypeYouTube, "")
+	}
+
+	removed := playlist.RemoveEntries([]string{"a", "c", "missing"})
+	if len(removed) != 2 || removed[0].OriginalInput != "a" || removed[1].OriginalInput != "c" {
+		t.Fatalf("Expected entries a and c removed, got %+v", removed)
+	}
+
+	expected := []string{"b", "a"}
+	if len(playlist.Entries) != len(expected) {
+		t.Fatalf("Expected %d entries left, got %d", len(expected), len(playlist.Entries))
+	}
+	for i, input := range expected {
+		if playlist.Entries[i].OriginalInput != input {
+			t.Errorf("Entry %d: expected %s, got %s", i, input, playlist.Entries[i].OriginalInput)
+		}
+	}
+}
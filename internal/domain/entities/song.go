@@ -3,6 +3,7 @@ package entities
 import (
 	"sync"
 	"time"
+	"unicode/utf8"
 
 	"github.com/google/uuid"
 	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/valueobjects"
@@ -30,9 +31,14 @@ type Song struct {
 	RequestedBy string `json:"requested_by,omitempty"`
 	GuildID     string `json:"guild_id,omitempty"`
 
+	displayTitle string // title truncated for listings, computed once per title change
+
 	mu sync.RWMutex
 }
 
+// displayTitleMaxLen is the longest title shown in queue listings
+const displayTitleMaxLen = 50
+
 // NewSong creates a new song with PENDING status
 func NewSong(originalInput string, sourceType valueobjects.SourceType, requestedBy, guildID string) *Song {
 	return &Song{
@@ -43,6 +49,7 @@ func NewSong(originalInput string, sourceType valueobjects.SourceType, requested
 		CreatedAt:     time.Now(),
 		RequestedBy:   requestedBy,
 		GuildID:       guildID,
+		displayTitle:  TruncateTitle(originalInput),
 	}
 }
 
@@ -66,6 +73,26 @@ func (s *Song) DisplayName() string {
 	return s.OriginalInput
 }
 
+// DisplayTitle returns the title shortened for queue listings
+func (s *Song) DisplayTitle() string {
+	s.mu.RLock()
+	defer s.mu.RUnlock()
+	return s.displayTitle
+}
+
+// TruncateTitle shortens a title to displayTitleMaxLen bytes without splitting a UTF-8 character
+func TruncateTitle(title string) string {
+	if len(title) <= displayTitleMaxLen {
+		return title
+	}
+
+	cut := displayTitleMaxLen - 3
+	for cut > 0 && !utf8.RuneStart(title[cut]) {
+		cut--
+	}
+	return title[:cut] + "..."
+}
+
 // DurationFormatted returns formatted duration
 func (s *Song) DurationFormatted() string {
 	s.mu.RLock()
@@ -93,6 +120,9 @@ func (s *Song) MarkReady(metadata *valueobjects.SongMetadata, streamURL string)
 
 	s.Status = valueobjects.SongStatusReady
 	s.Metadata = metadata
+	if metadata != nil {
+		s.displayTitle = TruncateTitle(metadata.Title)
+	}
 	s.StreamURL = streamURL
 	s.StreamURLTimestamp = time.Now()
 	s.ErrorMessage = ""
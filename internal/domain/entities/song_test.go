@@ -1,6 +1,7 @@
 package entities_test
 
 import (
+	"strings"
 	"testing"
 	"time"
 
@@ -150,3 +151,47 @@ func TestSongThreadSafety(t *testing.T) {
 		t.Error("Song should be ready after concurrent operations")
 	}
 }
+
+func TestSongDisplayTitle(t *testing.T) {
+	tests := []struct {
+		name     string
+		title    string
+		expected string
+	}{
+		{"Short title", "Short Song", "Short Song"},
+		{"Exactly max length", strings.Repeat("a", 50), strings.Repeat("a", 50)},
+		{"Long ASCII title", strings.Repeat("a", 60), strings.Repeat("a", 47) + "..."},
+		{"Long multibyte title", strings.Repeat("ạ", 30), strings.Repeat("ạ", 15) + "..."},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			song := entities.NewSong("url", valueobjects.SourceTypeYouTube, "User", "123456789")
+			song.MarkReady(&valueobjects.SongMetadata{Title: tt.title}, "https://stream.url")
+
+			if got := song.DisplayTitle(); got != tt.expected {
+				t.Errorf("DisplayTitle() = %q, expected %q", got, tt.expected)
+			}
+		})
+	}
+}
+
+func TestTruncateTitle(t *testing.T) {
+	tests := []struct {
+		name     string
+		title    string
+		expected string
+	}{
+		{"Short title unchanged", "Hello", "Hello"},
+		{"ASCII truncated", strings.Repeat("a", 51), strings.Repeat("a", 47) + "..."},
+		{"Cut backs off a split rune", strings.Repeat("a", 46) + "éfghij", strings.Repeat("a", 46) + "..."},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := entities.TruncateTitle(tt.title); got != tt.expected {
+				t.Errorf("TruncateTitle(%q) = %q, expected %q", tt.title, got, tt.expected)
+			}
+		})
+	}
+}
@@ -4,6 +4,7 @@ import (
 	"container/list"
 	"math/rand"
 	"sync"
+	"time"
 )
 
 // RepeatMode defines how the tracklist repeats
@@ -25,6 +26,7 @@ type Tracklist struct {
 
 	shuffleEnabled bool
 	repeatMode     RepeatMode
+	rng            *rand.Rand // per-tracklist source, created on first shuffle
 
 	mu sync.RWMutex
 }
@@ -51,6 +53,15 @@ func (t *Tracklist) AddSong(song *Song) int {
 	return len(t.songs)
 }
 
+// AddSongs appends several songs under a single lock and returns the new queue size
+func (t *Tracklist) AddSongs(songs []*Song) int {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+
+	t.songs = append(t.songs, songs...)
+	return len(t.songs)
+}
+
 // CurrentSong returns the currently playing song
 func (t *Tracklist) CurrentSong() *Song {
 	t.mu.RLock()
@@ -177,6 +188,26 @@ func (t *Tracklist) GetUpcoming(limit int) []*Song {
 	return upcoming
 }
 
+// GetRange returns a copy of the songs in [start, end), clamped to the queue bounds
+func (t *Tracklist) GetRange(start, end int) []*Song {
+	t.mu.RLock()
+	defer t.mu.RUnlock()
+
+	if start < 0 {
+		start = 0
+	}
+	if end > len(t.songs) {
+		end = len(t.songs)
+	}
+	if start >= end {
+		return []*Song{}
+	}
+
+	songs := make([]*Song, end-start)
+	copy(songs, t.songs[start:end])
+	return songs
+}
+
 // Size returns the total number of songs in queue
 func (t *Tracklist) Size() int {
 	t.mu.RLock()
@@ -256,26 +287,24 @@ func (t *Tracklist) Shuffle() {
 		return
 	}
 
-	// Keep current song, shuffle the rest
-	currentSong := t.songs[t.currentIndex]
+	// Move current song to the front, then shuffle the rest in place
+	remaining := t.songs
+	if t.currentIndex >= 0 && t.currentIndex < len(t.songs) {
+		t.songs[0], t.songs[t.currentIndex] = t.songs[t.currentIndex], t.songs[0]
+		t.currentIndex = 0
+		remaining = t.songs[1:]
+	}
 
-	// Remove current song from slice
-	remaining := make([]*Song, 0, len(t.songs)-1)
-	for i, s := range t.songs {
-		if i != t.currentIndex {
-			remaining = append(remaining, s)
-		}
+	// Own source guarded by t.mu, so concurrent shuffles don't share global generator state
+	if t.rng == nil {
+		t.rng = rand.New(rand.NewSource(time.Now().UnixNano()))
 	}
 
 	// Fisher-Yates shuffle
 	for i := len(remaining) - 1; i > 0; i-- {
-		j := rand.Intn(i + 1)
+		j := t.rng.Intn(i + 1)
 		remaining[i], remaining[j] = remaining[j], remaining[i]
 	}
-
-	// Rebuild songs with current song at start
-	t.songs = append([]*Song{currentSong}, remaining...)
-	t.currentIndex = 0
 }
 
 // IsShuffleEnabled returns whether shuffle is enabled
@@ -37,6 +37,24 @@ func TestTracklistAddSong(t *testing.T) {
 	}
 }
 
+func TestTracklistAddSongs(t *testing.T) {
+	tracklist := entities.NewTracklist("123456789")
+	tracklist.AddSong(entities.NewSong("url1", valueobjects.SourceTypeYouTube, "User1", "123456789"))
+
+	size := tracklist.AddSongs([]*entities.Song{
+		entities.NewSong("url2", valueobjects.SourceTypeYouTube, "User2", "123456789"),
+		entities.NewSong("url3", valueobjects.SourceTypeYouTube, "User3", "123456789"),
+	})
+
+	if size != 3 || tracklist.Size() != 3 {
+		t.Errorf("Expected size 3, got %d (reported %d)", tracklist.Size(), size)
+	}
+
+	if songs := tracklist.GetRange(2, 3); len(songs) != 1 || songs[0].OriginalInput != "url3" {
+		t.Error("Expected batch to be appended in order")
+	}
+}
+
 func TestTracklistNavigation(t *testing.T) {
 	tracklist := entities.NewTracklist("123456789")
 
@@ -212,3 +230,64 @@ func TestTracklistThreadSafety(t *testing.T) {
 		t.Error("Tracklist should have at least 10 songs after concurrent operations")
 	}
 }
+
+func TestTracklistShuffle(t *testing.T) {
+	tracklist := entities.NewTracklist("123456789")
+
+	songs := make([]*entities.Song, 20)
+	for i := range songs {
+		songs[i] = entities.NewSong("url", valueobjects.SourceTypeYouTube, "User", "123456789")
+		tracklist.AddSong(songs[i])
+	}
+
+	current := tracklist.SkipToPosition(5)
+	tracklist.Shuffle()
+
+	if tracklist.CurrentSong() != current {
+		t.Error("Current song should stay current after shuffle")
+	}
+
+	if pos, _ := tracklist.Position(); pos != 1 {
+		t.Errorf("Expected current song at position 1, got %d", pos)
+	}
+
+	// Every song should still be present exactly once
+	seen := make(map[string]int)
+	for _, song := range tracklist.GetAllSongs() {
+		seen[song.ID]++
+	}
+	for _, song := range songs {
+		if seen[song.ID] != 1 {
+			t.Errorf("Expected song %s once after shuffle, got %d", song.ID, seen[song.ID])
+		}
+	}
+}
+
+func TestTracklistGetRange(t *testing.T) {
+	tracklist := entities.NewTracklist("123456789")
+
+	for i := 0; i < 15; i++ {
+		song := entities.NewSong("url", valueobjects.SourceTypeYouTube, "User", "123456789")
+		tracklist.AddSong(song)
+	}
+
+	tests := []struct {
+		name       string
+		start, end int
+		expected   int
+	}{
+		{"First page", 0, 10, 10},
+		{"Partial last page", 10, 20, 5},
+		{"Negative start", -5, 3, 3},
+		{"Start past end", 20, 30, 0},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			songs := tracklist.GetRange(tt.start, tt.end)
+			if len(songs) != tt.expected {
+				t.Errorf("GetRange(%d, %d) returned %d songs, expected %d", tt.start, tt.end, len(songs), tt.expected)
+			}
+		})
+	}
+}
@@ -154,19 +154,20 @@ func (r *DatabasePlaylistRepository) Save(guildID string, playlist *entities.Pla
 		return fmt.Errorf("failed to clear playlist entries: %w", err)
 	}
 
-	// Add entries
-	for _, entry := range playlist.Entries {
+	// Add entries in one round trip rather than one per entry
+	params := make([]database.AddPlaylistEntryParams, len(playlist.Entries))
+	for i, entry := range playlist.Entries {
 		title := entry.Title
-		_, err := queries.AddPlaylistEntry(ctx, database.AddPlaylistEntryParams{
+		params[i] = database.AddPlaylistEntryParams{
 			PlaylistID:    playlistID,
 			OriginalInput: entry.OriginalInput,
 			SourceType:    string(entry.SourceType),
 			Title:         &title,
-		})
-		if err != nil {
-			return fmt.Errorf("failed to add playlist entry: %w", err)
 		}
 	}
+	if err := database.AddPlaylistEntries(ctx, tx, params); err != nil {
+		return err
+	}
 
 	if err := tx.Commit(ctx); err != nil {
 		return fmt.Errorf("failed to commit transaction: %w", err)
@@ -68,33 +68,65 @@ func (r *PlaylistRepository) Load(name string) (*entities.Playlist, error) {
 
 // Save saves a playlist to disk
 func (r *PlaylistRepository) Save(playlist *entities.Playlist) error {
-	// Ensure directory exists
-	if err := os.MkdirAll(r.baseDir, 0755); err != nil {
-		return fmt.Errorf("failed to create playlist directory: %w", err)
-	}
-
 	path := r.getPath(playlist.Name)
 
-	// Create backup if file exists
-	if _, err := os.Stat(path); err == nil {
-		backupPath := path + ".backup"
-		if data, err := os.ReadFile(path); err == nil {
-			os.WriteFile(backupPath, data, 0644)
+	// Compact encoding: smaller files and faster to write and parse than indented output
+	data, err := json.Marshal(playlist)
+	if err != nil {
+		return fmt.Errorf("failed to marshal playlist: %w", err)
+	}
+
+	// Write the new version beside the old one, then swap it in. Each save gets its
+	// own temp file, so concurrent saves of one playlist never share a name
+	tempFile, err := os.CreateTemp(r.baseDir, filepath.Base(path)+".*.tmp")
+	if os.IsNotExist(err) {
+		// Only the first save into a fresh directory needs to create it
+		if err := os.MkdirAll(r.baseDir, 0755); err != nil {
+			return fmt.Errorf("failed to create playlist directory: %w", err)
 		}
+		tempFile, err = os.CreateTemp(r.baseDir, filepath.Base(path)+".*.tmp")
+	}
+	if err != nil {
+		return fmt.Errorf("failed to write playlist file: %w", err)
 	}
+	tempPath := tempFile.Name()
 
-	data, err := json.MarshalIndent(playlist, "", "  ")
+	_, err = tempFile.Write(data)
+	if err == nil {
+		err = tempFile.Chmod(0644) // CreateTemp uses 0600; keep the usual playlist file mode
+	}
+	if closeErr := tempFile.Close(); err == nil {
+		err = closeErr
+	}
 	if err != nil {
-		return fmt.Errorf("failed to marshal playlist: %w", err)
+		os.Remove(tempPath)
+		return fmt.Errorf("failed to write playlist file: %w", err)
 	}
 
-	if err := os.WriteFile(path, data, 0644); err != nil {
+	r.backup(path)
+
+	if err := os.Rename(tempPath, path); err != nil {
+		os.Remove(tempPath)
 		return fmt.Errorf("failed to write playlist file: %w", err)
 	}
 
 	return nil
 }
 
+// backup keeps the current version of a playlist file as its .backup.
+// A hard link preserves the old contents without reading or rewriting them;
+// filesystems without link support fall back to a copy. Failures are ignored.
+func (r *PlaylistRepository) backup(path string) {
+	backupPath := path + ".backup"
+	os.Remove(backupPath)
+	if err := os.Link(path, backupPath); err == nil || os.IsNotExist(err) {
+		return
+	}
+	if data, err := os.ReadFile(path); err == nil {
+		os.WriteFile(backupPath, data, 0644)
+	}
+}
+
 // Delete deletes a playlist (moves to .deleted)
 func (r *PlaylistRepository) Delete(name string) error {
 	path := r.getPath(name)
@@ -0,0 +1,91 @@
+package repositories_test
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+	"testing"
+
+	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/entities"
+	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/repositories"
+	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/valueobjects"
+)
+
+func TestPlaylistRepositorySaveKeepsBackup(t *testing.T) {
+	dir := filepath.Join(t.TempDir(), "playlists")
+	repo := repositories.NewPlaylistRepository(dir)
+
+	playlist := entities.NewPlaylist("mix")
+	playlist.AddEntry("first", valueobjects.SourceTypeYouTube, "First")
+	if err := repo.Save(playlist); err != nil {
+		t.Fatalf("First save failed: %v", err)
+	}
+
+	playlist.AddEntry("second", valueobjects.SourceTypeYouTube, "Second")
+	if err := repo.Save(playlist); err != nil {
+		t.Fatalf("Second save failed: %v", err)
+	}
+
+	loaded, err := repo.Load("mix")
+	if err != nil || loaded == nil {
+		t.Fatalf("Load failed: %v", err)
+	}
+	if len(loaded.Entries) != 2 {
+		t.Errorf("Expected 2 entries after reload, got %d", len(loaded.Entries))
+	}
+
+	// The backup holds the version from before the second save
+	if err := os.Rename(filepath.Join(dir, "mix.json.backup"), filepath.Join(dir, "old.json")); err != nil {
+		t.Fatalf("Expected backup file: %v", err)
+	}
+	old, err := repo.Load("old")
+	if err != nil || old == nil {
+		t.Fatalf("Failed to load backup: %v", err)
+	}
+	if len(old.Entries) != 1 {
+		t.Errorf("Expected backup to keep 1 entry, got %d", len(old.Entries))
+	}
+
+	names, err := repo.List()
+	if err != nil {
+		t.Fatalf("List failed: %v", err)
+	}
+	if len(names) != 2 {
+		t.Errorf("Expected only playlist files to be listed, got %v", names)
+	}
+}
+
+func TestPlaylistRepositoryConcurrentSaves(t *testing.T) {
+	dir := filepath.Join(t.TempDir(), "playlists")
+	repo := repositories.NewPlaylistRepository(dir)
+
+	var wg sync.WaitGroup
+	for i := 0; i < 8; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			playlist := entities.NewPlaylist("mix")
+			playlist.AddEntry("song", valueobjects.SourceTypeYouTube, "Song")
+			if err := repo.Save(playlist); err != nil {
+				t.Errorf("Concurrent save failed: %v", err)
+			}
+		}()
+	}
+	wg.Wait()
+
+	loaded, err := repo.Load("mix")
+	if err != nil || loaded == nil || len(loaded.Entries) != 1 {
+		t.Fatalf("Expected a valid playlist after concurrent saves, got %v, %v", loaded, err)
+	}
+
+	files, err := os.ReadDir(dir)
+	if err != nil {
+		t.Fatal(err)
+	}
+	for _, file := range files {
+		if strings.HasSuffix(file.Name(), ".tmp") {
+			t.Errorf("Temp file left behind: %s", file.Name())
+		}
+	}
+}
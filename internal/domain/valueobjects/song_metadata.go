@@ -1,6 +1,9 @@
 package valueobjects
 
-import "fmt"
+import (
+	"fmt"
+	"strconv"
+)
 
 // SongMetadata contains metadata information about a song
 type SongMetadata struct {
@@ -25,7 +28,13 @@ func (m *SongMetadata) DurationFormatted() string {
 		return "00:00"
 	}
 
-	minutes := m.Duration / 60
-	seconds := m.Duration % 60
-	return fmt.Sprintf("%02d:%02d", minutes, seconds)
+	// Built by hand rather than with fmt: this runs for every line of a queue page
+	minutes, seconds := m.Duration/60, m.Duration%60
+	buf := make([]byte, 0, 8)
+	if minutes < 10 {
+		buf = append(buf, '0')
+	}
+	buf = strconv.AppendInt(buf, int64(minutes), 10)
+	buf = append(buf, ':', byte('0'+seconds/10), byte('0'+seconds%10))
+	return string(buf)
 }
@@ -0,0 +1,28 @@
+package valueobjects_test
+
+import (
+	"testing"
+
+	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/valueobjects"
+)
+
+func TestSongMetadataDurationFormatted(t *testing.T) {
+	tests := []struct {
+		duration int
+		expected string
+	}{
+		{0, "00:00"},
+		{-5, "00:00"},
+		{7, "00:07"},
+		{213, "03:33"},
+		{600, "10:00"},
+		{7384, "123:04"},
+	}
+
+	for _, tt := range tests {
+		meta := &valueobjects.SongMetadata{Duration: tt.duration}
+		if got := meta.DurationFormatted(); got != tt.expected {
+			t.Errorf("DurationFormatted() for %d = %s, expected %s", tt.duration, got, tt.expected)
+		}
+	}
+}
@@ -91,13 +91,14 @@ func (p *AudioPlayer) Play(song *entities.Song, callback PlaybackCallback) error
 	p.isPaused.Store(false)
 
 	// Start playback in goroutine
-	go p.playbackLoop(song, sourceURL)
+	// Hand the loop this playback's stop channel so it never re-reads the field
+	go p.playbackLoop(song, sourceURL, p.stopSignal)
 
 	return nil
 }
 
 // playbackLoop handles the actual playback
-func (p *AudioPlayer) playbackLoop(song *entities.Song, sourceURL string) {
+func (p *AudioPlayer) playbackLoop(song *entities.Song, sourceURL string, stop <-chan struct{}) {
 	frameCount := 0 // Declared here so the defer can check it
 
 	defer func() {
@@ -165,7 +166,7 @@ func (p *AudioPlayer) playbackLoop(song *entities.Song, sourceURL string) {
 	// Stream audio frames (frameCount declared at top of function for defer access)
 	for {
 		select {
-		case <-p.stopSignal:
+		case <-stop:
 			p.logger.Info("⏹️ Playback stopped by user")
 			return
 
@@ -191,20 +192,15 @@ func (p *AudioPlayer) playbackLoop(song *entities.Song, sourceURL string) {
 			}
 
 			// Handle pause
-			for p.isPaused.Load() {
-				select {
-				case <-p.stopSignal:
-					return
-				case <-time.After(100 * time.Millisecond):
-					// Continue checking pause state
-				}
+			if p.isPaused.Load() && !p.waitWhilePaused(stop) {
+				return
 			}
 
 			// Send frame to Discord
 			select {
 			case vc.OpusSend <- frame:
 				frameCount++
-			case <-p.stopSignal:
+			case <-stop:
 				p.logger.Info("⏹️ Playback stopped during frame send")
 				return
 			}
@@ -212,6 +208,23 @@ func (p *AudioPlayer) playbackLoop(song *entities.Song, sourceURL string) {
 	}
 }
 
+// waitWhilePaused polls the pause state until playback resumes, reusing one ticker
+// for the whole pause. Returns false if playback was stopped while paused.
+func (p *AudioPlayer) waitWhilePaused(stop <-chan struct{}) bool {
+	ticker := time.NewTicker(100 * time.Millisecond)
+	defer ticker.Stop()
+
+	for p.isPaused.Load() {
+		select {
+		case <-stop:
+			return false
+		case <-ticker.C:
+			// Continue checking pause state
+		}
+	}
+	return true
+}
+
 // Stop stops the current playback
 func (p *AudioPlayer) Stop() error {
 	p.mu.Lock()
@@ -101,9 +101,10 @@ func (s *AudioService) DisconnectFromGuild(guildID string) error {
 		delete(s.voiceConnections, guildID)
 	}
 
-	// Clear tracklist
+	// Clear and drop the tracklist so guilds the bot has left don't accumulate
 	if tracklist, exists := s.tracklists[guildID]; exists {
 		tracklist.Clear()
+		delete(s.tracklists, guildID)
 	}
 
 	return nil
@@ -304,12 +305,18 @@ func (s *AudioService) CleanupAll() {
 	}
 	s.audioPlayers = make(map[string]*AudioPlayer)
 
-	// Disconnect all voice connections
+	// Disconnect all voice connections concurrently; each waits on its own gateway round-trip
+	var wg sync.WaitGroup
 	for guildID, vc := range s.voiceConnections {
-		if err := vc.Disconnect(); err != nil {
-			s.logger.WithError(err).WithField("guild", guildID).Warn("Failed to disconnect voice")
-		}
+		wg.Add(1)
+		go func(guildID string, vc *VoiceConnection) {
+			defer wg.Done()
+			if err := vc.Disconnect(); err != nil {
+				s.logger.WithError(err).WithField("guild", guildID).Warn("Failed to disconnect voice")
+			}
+		}(guildID, vc)
 	}
+	wg.Wait()
 	s.voiceConnections = make(map[string]*VoiceConnection)
 
 	// Clear all tracklists
@@ -246,6 +246,26 @@ func TestAudioServiceTracklist(t *testing.T) {
 	}
 }
 
+func TestAudioServiceDisconnectReleasesTracklist(t *testing.T) {
+	log := logger.New(logger.Config{Level: "error"})
+	service := audio.NewAudioService(nil, log)
+
+	guildID := "test-guild-123"
+	service.GetTracklist(guildID)
+
+	if stats := service.GetStats(); stats["total_guilds"].(int) != 1 {
+		t.Fatalf("Expected 1 guild before disconnect, got %d", stats["total_guilds"])
+	}
+
+	if err := service.DisconnectFromGuild(guildID); err != nil {
+		t.Fatalf("DisconnectFromGuild returned error: %v", err)
+	}
+
+	if stats := service.GetStats(); stats["total_guilds"].(int) != 0 {
+		t.Errorf("Expected tracklist to be released after disconnect, got %d guilds", stats["total_guilds"])
+	}
+}
+
 func TestAudioServiceCleanup(t *testing.T) {
 	log := logger.New(logger.Config{Level: "error"})
 	service := audio.NewAudioService(nil, log)
@@ -6,6 +6,8 @@ import (
 	"fmt"
 	"io"
 	"os/exec"
+	"strconv"
+	"sync"
 	"time"
 
 	"github.com/jonas747/ogg"
@@ -19,6 +21,40 @@ var (
 	ErrAlreadyPlaying = errors.New("already playing")
 )
 
+// ytDlpBaseArgs are the yt-dlp flags shared by every stream; the URL is appended per call.
+// Includes options to bypass YouTube's 403 restrictions.
+var ytDlpBaseArgs = []string{
+	// Flexible format: takes best audio-only, falls back to best overall
+	"-f", "bestaudio/best",
+	"-o", "-", // Output to stdout
+	"--no-playlist",
+	"--no-check-certificate",
+	"--geo-bypass",
+	// Use node as JS runtime and fetch latest challenge solver from GitHub
+	// This solves YouTube's n-function signature challenge to prevent 403 errors
+	"--js-runtimes", "node",
+	"--remote-components", "ejs:github",
+	"--quiet",
+	"--no-warnings",
+}
+
+// Binaries are looked up in PATH once instead of on every song
+var (
+	ytDlpBinary  = lookPathOnce("yt-dlp")
+	ffmpegBinary = lookPathOnce("ffmpeg")
+)
+
+// lookPathOnce returns a function that resolves name through PATH on first use.
+// A failed lookup keeps the bare name, so the error still surfaces when the command runs.
+func lookPathOnce(name string) func() string {
+	return sync.OnceValue(func() string {
+		if path, err := exec.LookPath(name); err == nil {
+			return path
+		}
+		return name
+	})
+}
+
 // AudioEncoder handles encoding audio streams for Discord
 type AudioEncoder struct {
 	logger *logger.Logger
@@ -79,24 +115,10 @@ func (e *AudioEncoder) encodeWithYtDlpPipe(streamURL string, options *EncodeOpti
 	// yt-dlp downloads and outputs to stdout, FFmpeg reads from stdin and outputs Opus to stdout
 
 	// Start yt-dlp process to download audio to stdout
-	// Added options to bypass YouTube's 403 restrictions
-	ytDlpArgs := []string{
-		// Flexible format: takes best audio-only, falls back to best overall
-		"-f", "bestaudio/best",
-		"-o", "-", // Output to stdout
-		"--no-playlist",
-		"--no-check-certificate",
-		"--geo-bypass",
-		// Use node as JS runtime and fetch latest challenge solver from GitHub
-		// This solves YouTube's n-function signature challenge to prevent 403 errors
-		"--js-runtimes", "node",
-		"--remote-components", "ejs:github",
-		"--quiet",
-		"--no-warnings",
-		streamURL,
-	}
+	// Full slice expression forces append to copy instead of sharing the base array
+	ytDlpArgs := append(ytDlpBaseArgs[:len(ytDlpBaseArgs):len(ytDlpBaseArgs)], streamURL)
 
-	ytDlpCmd := exec.Command("yt-dlp", ytDlpArgs...)
+	ytDlpCmd := exec.Command(ytDlpBinary(), ytDlpArgs...)
 	ytDlpStdout, err := ytDlpCmd.StdoutPipe()
 	if err != nil {
 		e.logger.WithError(err).Error("❌ Failed to get yt-dlp stdout pipe")
@@ -139,14 +161,14 @@ func (e *AudioEncoder) encodeWithYtDlpPipe(streamURL string, options *EncodeOpti
 		"-compression_level", "5",
 		"-ar", "48000",
 		"-ac", "2",
-		"-b:a", fmt.Sprintf("%d", options.Bitrate*1000),
+		"-b:a", strconv.Itoa(options.Bitrate * 1000),
 		"-application", options.Application,
 		"-frame_duration", "20",
 		"-loglevel", "error",
 		"pipe:1", // Output to stdout
 	}
 
-	ffmpegCmd := exec.Command("ffmpeg", ffmpegArgs...)
+	ffmpegCmd := exec.Command(ffmpegBinary(), ffmpegArgs...)
 	ffmpegCmd.Stdin = ytDlpStdout // Connect yt-dlp stdout to FFmpeg stdin
 
 	ffmpegStdout, err := ffmpegCmd.StdoutPipe()
@@ -239,16 +261,18 @@ func (e *AudioEncoder) encodeWithYtDlpPipe(streamURL string, options *EncodeOpti
 		if len(packet) > 0 {
 			frameCount++
 
+			// One clock read per frame serves both the progress log and the pacing below
+			now := time.Now()
+
 			// Log progress every 5 seconds
-			if time.Since(lastLogTime) > 5*time.Second {
+			if now.Sub(lastLogTime) > 5*time.Second {
 				e.logger.WithField("frames", frameCount).Debug("Encoding in progress...")
-				lastLogTime = time.Now()
+				lastLogTime = now
 			}
 
 			// Rate limiting: wait until it's time to send this frame
 			// This prevents buffer overflow by matching encode rate to playback rate
 			expectedTime := startTime.Add(time.Duration(frameCount) * frameInterval)
-			now := time.Now()
 			if now.Before(expectedTime) {
 				time.Sleep(expectedTime.Sub(now))
 			}
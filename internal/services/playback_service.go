@@ -17,8 +17,9 @@ import (
 var (
 	// ErrNotPlaying is returned when no song is playing
 	ErrNotPlaying = errors.New("no song is currently playing")
-	// ErrAlreadyPlaying is returned when already playing
-	ErrAlreadyPlaying = errors.New("already playing")
+	// ErrAlreadyPlaying is returned when already playing. It is the audio player's
+	// error, so errors.Is matches whether it came from the player or this service.
+	ErrAlreadyPlaying = audio.ErrAlreadyPlaying
 )
 
 // PlaybackService orchestrates the complete playback flow
@@ -194,6 +195,33 @@ func (s *PlaybackService) AddSong(guildID string, song *entities.Song) error {
 	return s.processingService.Submit(song, 0)
 }
 
+// AddSongs adds several songs to the queue in one step and starts processing them.
+// Returns how many songs were submitted for processing.
+func (s *PlaybackService) AddSongs(guildID string, songs []*entities.Song) int {
+	if len(songs) == 0 {
+		return 0
+	}
+
+	state := s.getOrCreateState(guildID)
+	state.tracklist.AddSongs(songs)
+
+	submitted := 0
+	for _, song := range songs {
+		if err := s.processingService.Submit(song, 0); err != nil {
+			s.logger.WithError(err).WithField("song_id", song.ID).Warn("Failed to submit song for processing")
+			continue
+		}
+		submitted++
+	}
+
+	s.logger.WithFields(map[string]interface{}{
+		"guild": guildID,
+		"count": len(songs),
+	}).Info("Songs added to queue")
+
+	return submitted
+}
+
 // playbackLoop is the main playback loop for a guild
 func (s *PlaybackService) playbackLoop(state *GuildPlaybackState) {
 	s.logger.WithField("guild", state.guildID).Debug("Playback loop started")
@@ -293,11 +321,18 @@ func (s *PlaybackService) playNextSong(state *GuildPlaybackState) bool {
 
 // waitForSong waits for a song to become ready
 func (s *PlaybackService) waitForSong(song *entities.Song, ctx context.Context) bool {
+	// Fast path: songs are usually processed before they reach the front of the queue,
+	// so skip setting up the poll ticker and timeout timer
+	if song.GetStatus() == valueobjects.SongStatusReady {
+		return true
+	}
+
 	ticker := time.NewTicker(100 * time.Millisecond)
 	defer ticker.Stop()
 
 	// Use 30 seconds timeout (can be made configurable later)
-	timeout := time.After(30 * time.Second)
+	timeout := time.NewTimer(30 * time.Second)
+	defer timeout.Stop()
 
 	for {
 		status := song.GetStatus()
@@ -317,7 +352,7 @@ func (s *PlaybackService) waitForSong(song *entities.Song, ctx context.Context)
 		select {
 		case <-ticker.C:
 			continue
-		case <-timeout:
+		case <-timeout.C:
 			s.logger.WithFields(map[string]interface{}{
 				"song_id": song.ID,
 				"status":  status,
@@ -359,9 +394,15 @@ func (s *PlaybackService) handleFailedSong(state *GuildPlaybackState, song *enti
 
 // getOrCreateState gets or creates guild state
 func (s *PlaybackService) getOrCreateState(guildID string) *GuildPlaybackState {
+	// Existing guilds are the common case and only need the read lock
+	if state := s.getState(guildID); state != nil {
+		return state
+	}
+
 	s.mu.Lock()
 	defer s.mu.Unlock()
 
+	// Double-check after acquiring write lock
 	if state, exists := s.guildStates[guildID]; exists {
 		return state
 	}
@@ -169,6 +169,50 @@ func (s *PlaylistService) AddToPlaylistForGuild(guildID, name, originalInput str
 	return nil
 }
 
+// AddManyToPlaylistForGuild adds several songs to a playlist for a specific guild with a single save
+// Songs already in the playlist (or repeated in entries) are skipped; returns the number added
+func (s *PlaylistService) AddManyToPlaylistForGuild(guildID, name string, entries []entities.PlaylistEntry) (int, error) {
+	playlist, err := s.repo.Load(guildID, name)
+	if err != nil {
+		return 0, err
+	}
+	if playlist == nil {
+		return 0, fmt.Errorf("playlist '%s' not found", name)
+	}
+
+	existing := make(map[string]struct{}, len(playlist.Entries)+len(entries))
+	for _, entry := range playlist.Entries {
+		existing[entry.OriginalInput] = struct{}{}
+	}
+
+	added := 0
+	for _, entry := range entries {
+		if _, ok := existing[entry.OriginalInput]; ok {
+			continue
+		}
+		existing[entry.OriginalInput] = struct{}{}
+		playlist.AddEntry(entry.OriginalInput, entry.SourceType, entry.Title)
+		added++
+	}
+
+	if added == 0 {
+		return 0, nil
+	}
+
+	if err := s.repo.Save(guildID, playlist); err != nil {
+		s.logger.WithError(err).Error("Failed to save playlist")
+		return 0, err
+	}
+
+	s.logger.WithFields(map[string]interface{}{
+		"playlist": name,
+		"added":    added,
+		"skipped":  len(entries) - added,
+	}).Info("Songs added to playlist")
+
+	return added, nil
+}
+
 // RemoveFromPlaylist removes a song from a playlist
 func (s *PlaylistService) RemoveFromPlaylist(name, originalInput string) error {
 	return s.RemoveFromPlaylistForGuild("", name, originalInput)
@@ -200,6 +244,35 @@ func (s *PlaylistService) RemoveFromPlaylistForGuild(guildID, name, originalInpu
 	return nil
 }
 
+// RemoveManyFromPlaylistForGuild removes several songs from a playlist for a specific guild with a single save
+// Returns the entries that were removed
+func (s *PlaylistService) RemoveManyFromPlaylistForGuild(guildID, name string, originalInputs []string) ([]*entities.PlaylistEntry, error) {
+	playlist, err := s.repo.Load(guildID, name)
+	if err != nil {
+		return nil, err
+	}
+	if playlist == nil {
+		return nil, fmt.Errorf("playlist '%s' not found", name)
+	}
+
+	removed := playlist.RemoveEntries(originalInputs)
+	if len(removed) == 0 {
+		return nil, fmt.Errorf("song not found in playlist")
+	}
+
+	if err := s.repo.Save(guildID, playlist); err != nil {
+		s.logger.WithError(err).Error("Failed to save playlist")
+		return nil, err
+	}
+
+	s.logger.WithFields(map[string]interface{}{
+		"playlist": name,
+		"removed":  len(removed),
+	}).Info("Songs removed from playlist")
+
+	return removed, nil
+}
+
 // GetPlaylistSongs returns all songs in a playlist as Song entities
 func (s *PlaylistService) GetPlaylistSongs(name string) ([]*entities.Song, error) {
 	return s.GetPlaylistSongsForGuild("", name)
@@ -215,17 +288,7 @@ func (s *PlaylistService) GetPlaylistSongsForGuild(guildID, name string) ([]*ent
 		return nil, fmt.Errorf("playlist '%s' not found", name)
 	}
 
-	songs := make([]*entities.Song, 0, len(playlist.Entries))
-	for _, entry := range playlist.Entries {
-		song := entities.NewSong(entry.OriginalInput, entry.SourceType, "", "")
-		// Pre-set metadata with title from playlist (won't be ready until processed)
-		song.Metadata = &valueobjects.SongMetadata{
-			Title: entry.Title,
-		}
-		songs = append(songs, song)
-	}
-
-	return songs, nil
+	return playlist.Songs(), nil
 }
 
 // PlaylistExists checks if a playlist exists
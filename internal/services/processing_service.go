@@ -5,6 +5,7 @@ import (
 	"errors"
 	"strings"
 	"sync"
+	"sync/atomic"
 
 	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/entities"
 	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/valueobjects"
@@ -19,6 +20,10 @@ var (
 	ErrMaxQueueSize = errors.New("processing queue is full")
 )
 
+// extractBatchSize is the most queued songs a worker takes at once, so their
+// URLs are extracted by a single yt-dlp run instead of one process per song
+const extractBatchSize = 5
+
 // ProcessingTask represents a song processing task
 type ProcessingTask struct {
 	Song     *entities.Song
@@ -35,8 +40,8 @@ type ProcessingService struct {
 	ctx        context.Context
 	cancel     context.CancelFunc
 	mu         sync.RWMutex
-	processing map[string]bool // Track songs being processed
-	stats      ProcessingStats
+	processing map[string]bool // Songs queued or being processed; its size is the pending count
+	stats      processingCounters
 }
 
 // ProcessingStats tracks processing statistics
@@ -46,6 +51,12 @@ type ProcessingStats struct {
 	Pending   int64
 }
 
+// processingCounters holds the live statistics; bumps are atomic so they never contend on mu
+type processingCounters struct {
+	processed atomic.Int64
+	failed    atomic.Int64
+}
+
 // NewProcessingService creates a new processing service
 func NewProcessingService(ytService *youtube.Service, workers int, queueSize int, log *logger.Logger) *ProcessingService {
 	ctx, cancel := context.WithCancel(context.Background())
@@ -101,13 +112,12 @@ func (s *ProcessingService) Submit(song *entities.Song, priority int) error {
 
 	select {
 	case s.queue <- task:
-		s.mu.Lock()
-		s.stats.Pending++
-		s.mu.Unlock()
-		s.logger.WithFields(map[string]interface{}{
-			"song_id":  song.ID,
-			"priority": priority,
-		}).Debug("Song submitted for processing")
+		if s.logger.DebugEnabled() {
+			s.logger.WithFields(map[string]interface{}{
+				"song_id":  song.ID,
+				"priority": priority,
+			}).Debug("Song submitted for processing")
+		}
 		return nil
 	case <-s.ctx.Done():
 		s.mu.Lock()
@@ -143,6 +153,14 @@ func (s *ProcessingService) worker(id int) {
 
 			s.processTask(task, id)
 
+			// Songs already waiting behind this one share a single yt-dlp run; the
+			// first song is handled on its own so it is not delayed by the batch
+			batch := s.drainBatch()
+			s.prefetchBatch(batch)
+			for _, task := range batch {
+				s.processTask(task, id)
+			}
+
 		case <-s.ctx.Done():
 			s.logger.WithField("worker_id", id).Debug("Worker stopping - context cancelled")
 			return
@@ -150,6 +168,46 @@ func (s *ProcessingService) worker(id int) {
 	}
 }
 
+// drainBatch returns up to extractBatchSize tasks that are already queued,
+// without waiting for more to arrive
+func (s *ProcessingService) drainBatch() []*ProcessingTask {
+	var batch []*ProcessingTask
+	for len(batch) < extractBatchSize {
+		select {
+		case task, ok := <-s.queue:
+			if !ok {
+				return batch
+			}
+			batch = append(batch, task)
+		default:
+			return batch
+		}
+	}
+	return batch
+}
+
+// prefetchBatch extracts the info for every web URL in the batch with one yt-dlp run
+func (s *ProcessingService) prefetchBatch(batch []*ProcessingTask) {
+	if len(batch) < 2 {
+		return
+	}
+
+	urls := make([]string, 0, len(batch))
+	for _, task := range batch {
+		if task.Song.SourceType == valueobjects.SourceTypeYouTube && isWebURL(task.Song.OriginalInput) {
+			urls = append(urls, task.Song.OriginalInput)
+		}
+	}
+	if len(urls) > 1 {
+		s.ytService.PrefetchInfo(urls)
+	}
+}
+
+// isWebURL reports whether source is an http(s) URL rather than a search query
+func isWebURL(source string) bool {
+	return strings.HasPrefix(source, "http://") || strings.HasPrefix(source, "https://")
+}
+
 // processTask processes a single task
 func (s *ProcessingService) processTask(task *ProcessingTask, workerID int) {
 	song := task.Song
@@ -158,7 +216,6 @@ func (s *ProcessingService) processTask(task *ProcessingTask, workerID int) {
 	defer func() {
 		s.mu.Lock()
 		delete(s.processing, songID)
-		s.stats.Pending--
 		s.mu.Unlock()
 	}()
 
@@ -198,25 +255,30 @@ func (s *ProcessingService) processYouTubeSong(song *entities.Song) error {
 	source := song.OriginalInput
 
 	// Check if it's a web URL (YouTube, SoundCloud, or other yt-dlp supported sites)
-	if strings.HasPrefix(source, "http://") || strings.HasPrefix(source, "https://") {
-		// Extract info from URL using yt-dlp
+	if isWebURL(source) {
+		// Extract info from URL using yt-dlp (usually cached by prefetchBatch)
 		info, err := s.ytService.ExtractInfo(source)
 		if err != nil {
 			return err
 		}
 
-		// Get stream URL - use original source URL for non-YouTube platforms
-		// For YouTube, info.ID is the video ID; for SoundCloud/others, use the full URL
-		var identifier string
-		if youtube.IsYouTubeURL(source) {
-			identifier = info.ID // YouTube video ID
-		} else {
-			identifier = source // Full URL for SoundCloud, etc.
-		}
+		// ExtractInfo already selected bestaudio, so its output usually carries the stream
+		// URL; only fall back to a second yt-dlp run when it does not
+		streamURL := info.StreamURL
+		if streamURL == "" {
+			// Use original source URL for non-YouTube platforms
+			// For YouTube, info.ID is the video ID; for SoundCloud/others, use the full URL
+			var identifier string
+			if youtube.IsYouTubeURL(source) {
+				identifier = info.ID // YouTube video ID
+			} else {
+				identifier = source // Full URL for SoundCloud, etc.
+			}
 
-		streamURL, err := s.ytService.GetStreamURL(identifier)
-		if err != nil {
-			return err
+			streamURL, err = s.ytService.GetStreamURL(identifier)
+			if err != nil {
+				return err
+			}
 		}
 
 		// Mark as ready with metadata
@@ -269,21 +331,24 @@ func (s *ProcessingService) processURLSong(song *entities.Song) error {
 
 // updateStats updates processing statistics
 func (s *ProcessingService) updateStats(success bool) {
-	s.mu.Lock()
-	defer s.mu.Unlock()
-
 	if success {
-		s.stats.Processed++
+		s.stats.processed.Add(1)
 	} else {
-		s.stats.Failed++
+		s.stats.failed.Add(1)
 	}
 }
 
-// GetStats returns processing statistics
+// GetStats returns a snapshot of processing statistics
 func (s *ProcessingService) GetStats() ProcessingStats {
 	s.mu.RLock()
-	defer s.mu.RUnlock()
-	return s.stats
+	pending := len(s.processing)
+	s.mu.RUnlock()
+
+	return ProcessingStats{
+		Processed: s.stats.processed.Load(),
+		Failed:    s.stats.failed.Load(),
+		Pending:   int64(pending),
+	}
 }
 
 // QueueSize returns current queue size
@@ -16,5 +16,5 @@ func IsPlaylistURL(url string) bool {
 
 // IsTrackURL checks if the URL is a single SoundCloud track
 func IsTrackURL(url string) bool {
-	return IsSoundCloudURL(url) && !IsPlaylistURL(url)
+	return IsSoundCloudURL(url) && !strings.Contains(url, "/sets/")
 }
@@ -5,28 +5,28 @@ import (
 	"encoding/json"
 	"fmt"
 	"io"
+	"math/rand"
 	"net/http"
 	"net/url"
 	"regexp"
+	"strconv"
 	"strings"
+	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/vuongmanhnghia/discord-music-bot/pkg/logger"
 )
 
-var (
-	// Regex patterns for Spotify URLs
-	trackRegex    = regexp.MustCompile(`spotify\.com/track/([a-zA-Z0-9]+)`)
-	playlistRegex = regexp.MustCompile(`spotify\.com/playlist/([a-zA-Z0-9]+)`)
-	albumRegex    = regexp.MustCompile(`spotify\.com/album/([a-zA-Z0-9]+)`)
-)
+// spotifyURLRegex matches track, playlist and album URLs in one pass, capturing the type and ID
+var spotifyURLRegex = regexp.MustCompile(`spotify\.com/(track|playlist|album)/([a-zA-Z0-9]+)`)
 
 // Service handles Spotify API operations
 type Service struct {
 	clientID     string
 	clientSecret string
-	accessToken  string
-	tokenExpiry  time.Time
+	token        atomic.Pointer[accessToken] // current token, replaced whole on refresh
+	tokenMu      sync.Mutex                  // serializes refreshes
 	logger       *logger.Logger
 	httpClient   *http.Client
 }
@@ -61,13 +61,48 @@ type PlaylistTracksResponse struct {
 	Items []struct {
 		Track Track `json:"track"`
 	} `json:"items"`
-	Next string `json:"next"`
+	Next  string `json:"next"`
+	Total int    `json:"total"`
+	Limit int    `json:"limit"`
 }
 
 // AlbumTracksResponse represents Spotify album tracks response
 type AlbumTracksResponse struct {
 	Items []Track `json:"items"`
 	Next  string  `json:"next"`
+	Total int     `json:"total"`
+	Limit int     `json:"limit"`
+}
+
+// pageFetchConcurrency bounds how many result pages are requested from Spotify at once
+const pageFetchConcurrency = 4
+
+// trackPage is one decoded page of a paginated tracks endpoint
+type trackPage struct {
+	tracks []Track
+	total  int
+	limit  int
+}
+
+const (
+	// maxRateLimitRetries is how many times a rate limited request is retried
+	maxRateLimitRetries = 3
+	// maxRetryWait caps the wait between retries, including Spotify's Retry-After
+	maxRetryWait = 10 * time.Second
+)
+
+// tokenRefreshMargin is how long before expiry an access token is replaced
+const tokenRefreshMargin = 5 * time.Minute
+
+// accessToken is an immutable snapshot of a Spotify access token
+type accessToken struct {
+	value     string
+	refreshAt time.Time
+}
+
+// fresh reports whether the token can still be used without refreshing
+func (t *accessToken) fresh() bool {
+	return t != nil && time.Now().Before(t.refreshAt)
 }
 
 // TokenResponse represents Spotify token response
@@ -129,46 +164,98 @@ func (s *Service) refreshAccessToken() error {
 		return err
 	}
 
-	s.accessToken = tokenResp.AccessToken
-	s.tokenExpiry = time.Now().Add(time.Duration(tokenResp.ExpiresIn) * time.Second)
+	expiresIn := time.Duration(tokenResp.ExpiresIn) * time.Second
+	s.token.Store(&accessToken{
+		value:     tokenResp.AccessToken,
+		refreshAt: time.Now().Add(expiresIn - tokenRefreshMargin),
+	})
 
 	s.logger.Debug("Spotify access token refreshed")
 	return nil
 }
 
-// ensureValidToken ensures we have a valid access token
-func (s *Service) ensureValidToken() error {
-	if time.Now().After(s.tokenExpiry.Add(-5 * time.Minute)) {
-		return s.refreshAccessToken()
+// validToken returns a valid access token, refreshing it first if it is about to expire.
+// Requests read the current token without locking; only a refresh takes tokenMu, so
+// concurrent requests that find the token stale trigger a single refresh.
+func (s *Service) validToken() (string, error) {
+	if t := s.token.Load(); t.fresh() {
+		return t.value, nil
 	}
-	return nil
+
+	s.tokenMu.Lock()
+	defer s.tokenMu.Unlock()
+
+	// Another request may have refreshed while we waited for the lock
+	if t := s.token.Load(); t.fresh() {
+		return t.value, nil
+	}
+
+	if err := s.refreshAccessToken(); err != nil {
+		return "", err
+	}
+	return s.token.Load().value, nil
 }
 
-// makeRequest makes an authenticated request to Spotify API
+// makeRequest makes an authenticated request to Spotify API, retrying when rate limited
 func (s *Service) makeRequest(endpoint string) ([]byte, error) {
-	if err := s.ensureValidToken(); err != nil {
+	token, err := s.validToken()
+	if err != nil {
 		return nil, err
 	}
 
+	for attempt := 0; ; attempt++ {
+		body, wait, err := s.doRequest(endpoint, token, attempt)
+		if wait == 0 || attempt >= maxRateLimitRetries {
+			return body, err
+		}
+
+		s.logger.WithFields(map[string]interface{}{
+			"attempt": attempt + 1,
+			"wait":    wait.String(),
+		}).Warn("Spotify rate limit hit, retrying")
+		time.Sleep(wait)
+	}
+}
+
+// doRequest performs a single API request. When Spotify rate limits it, the
+// returned wait is how long to back off before retrying; otherwise it is zero.
+func (s *Service) doRequest(endpoint, token string, attempt int) ([]byte, time.Duration, error) {
 	req, err := http.NewRequest("GET", endpoint, nil)
 	if err != nil {
-		return nil, err
+		return nil, 0, err
 	}
 
-	req.Header.Set("Authorization", "Bearer "+s.accessToken)
+	req.Header.Set("Authorization", "Bearer "+token)
 
 	resp, err := s.httpClient.Do(req)
 	if err != nil {
-		return nil, err
+		return nil, 0, err
 	}
 	defer resp.Body.Close()
 
 	if resp.StatusCode != http.StatusOK {
 		body, _ := io.ReadAll(resp.Body)
-		return nil, fmt.Errorf("spotify API error: %s - %s", resp.Status, string(body))
+		err := fmt.Errorf("spotify API error: %s - %s", resp.Status, string(body))
+		if resp.StatusCode == http.StatusTooManyRequests {
+			return nil, retryDelay(resp.Header.Get("Retry-After"), attempt), err
+		}
+		return nil, 0, err
+	}
+
+	body, err := io.ReadAll(resp.Body)
+	return body, 0, err
+}
+
+// retryDelay returns how long to wait before retry number attempt+1. Spotify's
+// Retry-After is honoured when present; otherwise the exponential backoff is
+// jittered so concurrent page fetches don't all retry at the same moment.
+func retryDelay(retryAfter string, attempt int) time.Duration {
+	if secs, err := strconv.Atoi(retryAfter); err == nil && secs > 0 {
+		return min(time.Duration(secs)*time.Second, maxRetryWait)
 	}
 
-	return io.ReadAll(resp.Body)
+	backoff := min(time.Second<<attempt, maxRetryWait)
+	return backoff/2 + time.Duration(rand.Int63n(int64(backoff/2)+1))
 }
 
 // GetTrack gets track information by ID
@@ -190,51 +277,93 @@ func (s *Service) GetTrack(trackID string) (*Track, error) {
 
 // GetPlaylistTracks gets all tracks from a playlist
 func (s *Service) GetPlaylistTracks(playlistID string) ([]Track, error) {
-	var allTracks []Track
 	endpoint := fmt.Sprintf("https://api.spotify.com/v1/playlists/%s/tracks", playlistID)
+	return s.fetchAllTracks(endpoint, decodePlaylistPage)
+}
 
-	for endpoint != "" {
-		body, err := s.makeRequest(endpoint)
-		if err != nil {
-			return nil, err
-		}
+// GetAlbumTracks gets all tracks from an album
+func (s *Service) GetAlbumTracks(albumID string) ([]Track, error) {
+	endpoint := fmt.Sprintf("https://api.spotify.com/v1/albums/%s/tracks", albumID)
+	return s.fetchAllTracks(endpoint, decodeAlbumPage)
+}
 
-		var resp PlaylistTracksResponse
-		if err := json.Unmarshal(body, &resp); err != nil {
-			return nil, err
-		}
+// fetchAllTracks fetches the first page of a paginated tracks endpoint, then requests
+// the remaining pages concurrently by offset and returns all tracks in order
+func (s *Service) fetchAllTracks(endpoint string, decode func([]byte) (trackPage, error)) ([]Track, error) {
+	first, err := s.fetchTrackPage(endpoint, decode)
+	if err != nil {
+		return nil, err
+	}
+	if first.limit <= 0 || first.total <= first.limit {
+		return first.tracks, nil
+	}
 
-		for _, item := range resp.Items {
-			allTracks = append(allTracks, item.Track)
-		}
+	// The first page reports the total, so every remaining offset is known up front
+	remaining := (first.total - 1) / first.limit
+	pages := make([][]Track, remaining)
+	errs := make([]error, remaining)
+
+	var next atomic.Int64
+	var wg sync.WaitGroup
+	for w := 0; w < min(pageFetchConcurrency, remaining); w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for {
+				idx := int(next.Add(1) - 1)
+				if idx >= remaining {
+					return
+				}
+				pageURL := fmt.Sprintf("%s?offset=%d&limit=%d", endpoint, (idx+1)*first.limit, first.limit)
+				page, err := s.fetchTrackPage(pageURL, decode)
+				pages[idx], errs[idx] = page.tracks, err
+			}
+		}()
+	}
+	wg.Wait()
 
-		endpoint = resp.Next
+	allTracks := make([]Track, 0, first.total)
+	allTracks = append(allTracks, first.tracks...)
+	for idx, page := range pages {
+		if errs[idx] != nil {
+			return nil, errs[idx]
+		}
+		allTracks = append(allTracks, page...)
 	}
 
 	return allTracks, nil
 }
 
-// GetAlbumTracks gets all tracks from an album
-func (s *Service) GetAlbumTracks(albumID string) ([]Track, error) {
-	var allTracks []Track
-	endpoint := fmt.Sprintf("https://api.spotify.com/v1/albums/%s/tracks", albumID)
-
-	for endpoint != "" {
-		body, err := s.makeRequest(endpoint)
-		if err != nil {
-			return nil, err
-		}
+// fetchTrackPage requests and decodes a single page of tracks
+func (s *Service) fetchTrackPage(endpoint string, decode func([]byte) (trackPage, error)) (trackPage, error) {
+	body, err := s.makeRequest(endpoint)
+	if err != nil {
+		return trackPage{}, err
+	}
+	return decode(body)
+}
 
-		var resp AlbumTracksResponse
-		if err := json.Unmarshal(body, &resp); err != nil {
-			return nil, err
-		}
+// decodePlaylistPage decodes a page of playlist tracks
+func decodePlaylistPage(body []byte) (trackPage, error) {
+	var resp PlaylistTracksResponse
+	if err := json.Unmarshal(body, &resp); err != nil {
+		return trackPage{}, err
+	}
 
-		allTracks = append(allTracks, resp.Items...)
-		endpoint = resp.Next
+	tracks := make([]Track, len(resp.Items))
+	for i, item := range resp.Items {
+		tracks[i] = item.Track
 	}
+	return trackPage{tracks: tracks, total: resp.Total, limit: resp.Limit}, nil
+}
 
-	return allTracks, nil
+// decodeAlbumPage decodes a page of album tracks
+func decodeAlbumPage(body []byte) (trackPage, error) {
+	var resp AlbumTracksResponse
+	if err := json.Unmarshal(body, &resp); err != nil {
+		return trackPage{}, err
+	}
+	return trackPage{tracks: resp.Items, total: resp.Total, limit: resp.Limit}, nil
 }
 
 // ToSearchQuery converts a track to a YouTube search query
@@ -273,14 +402,11 @@ func IsSpotifyURL(urlStr string) bool {
 
 // ParseSpotifyURL parses a Spotify URL and returns the type and ID
 func ParseSpotifyURL(urlStr string) (urlType, id string, err error) {
-	if matches := trackRegex.FindStringSubmatch(urlStr); len(matches) > 1 {
-		return "track", matches[1], nil
-	}
-	if matches := playlistRegex.FindStringSubmatch(urlStr); len(matches) > 1 {
-		return "playlist", matches[1], nil
+	if !IsSpotifyURL(urlStr) {
+		return "", "", fmt.Errorf("invalid Spotify URL")
 	}
-	if matches := albumRegex.FindStringSubmatch(urlStr); len(matches) > 1 {
-		return "album", matches[1], nil
+	if matches := spotifyURLRegex.FindStringSubmatch(urlStr); len(matches) > 2 {
+		return matches[1], matches[2], nil
 	}
 	return "", "", fmt.Errorf("invalid Spotify URL")
 }
@@ -0,0 +1,124 @@
+package spotify
+
+import (
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"strconv"
+	"testing"
+	"time"
+)
+
+func TestValidTokenReusesFreshToken(t *testing.T) {
+	// No credentials or HTTP client: a refresh attempt would fail the test
+	svc := &Service{}
+	svc.token.Store(&accessToken{value: "cached", refreshAt: time.Now().Add(time.Minute)})
+
+	token, err := svc.validToken()
+	if err != nil {
+		t.Fatalf("Expected cached token, got error: %v", err)
+	}
+	if token != "cached" {
+		t.Errorf("Expected cached token, got %q", token)
+	}
+}
+
+func TestAccessTokenFresh(t *testing.T) {
+	tests := []struct {
+		name     string
+		token    *accessToken
+		expected bool
+	}{
+		{"No token yet", nil, false},
+		{"Before refresh time", &accessToken{refreshAt: time.Now().Add(time.Minute)}, true},
+		{"Past refresh time", &accessToken{refreshAt: time.Now().Add(-time.Second)}, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := tt.token.fresh(); got != tt.expected {
+				t.Errorf("fresh() = %v, expected %v", got, tt.expected)
+			}
+		})
+	}
+}
+
+func TestFetchAllTracksKeepsPageOrder(t *testing.T) {
+	const total, limit = 45, 20
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		offset, _ := strconv.Atoi(r.URL.Query().Get("offset"))
+		resp := AlbumTracksResponse{Total: total, Limit: limit}
+		for i := offset; i < min(offset+limit, total); i++ {
+			resp.Items = append(resp.Items, Track{ID: strconv.Itoa(i)})
+		}
+		json.NewEncoder(w).Encode(resp)
+	}))
+	defer server.Close()
+
+	svc := &Service{httpClient: server.Client()}
+	svc.token.Store(&accessToken{value: "cached", refreshAt: time.Now().Add(time.Minute)})
+
+	tracks, err := svc.fetchAllTracks(server.URL+"/tracks", decodeAlbumPage)
+	if err != nil {
+		t.Fatalf("fetchAllTracks failed: %v", err)
+	}
+	if len(tracks) != total {
+		t.Fatalf("Expected %d tracks, got %d", total, len(tracks))
+	}
+	for i, track := range tracks {
+		if track.ID != strconv.Itoa(i) {
+			t.Fatalf("Track %d out of order: got ID %s", i, track.ID)
+		}
+	}
+}
+
+func TestParseSpotifyURL(t *testing.T) {
+	tests := []struct {
+		url      string
+		wantType string
+		wantID   string
+		wantErr  bool
+	}{
+		{"https://open.spotify.com/track/4uLU6hMCjMI75M1A2tKUQC?si=abc", "track", "4uLU6hMCjMI75M1A2tKUQC", false},
+		{"https://open.spotify.com/playlist/37i9dQZF1DXcBWIGoYBM5M", "playlist", "37i9dQZF1DXcBWIGoYBM5M", false},
+		{"https://open.spotify.com/album/1DFixLWuPkv3KT3TnV35m3", "album", "1DFixLWuPkv3KT3TnV35m3", false},
+		{"https://open.spotify.com/artist/0OdUWJ0sBjDrqHygGUXeCF", "", "", true},
+		{"https://www.youtube.com/watch?v=dQw4w9WgXcQ", "", "", true},
+	}
+
+	for _, tt := range tests {
+		urlType, id, err := ParseSpotifyURL(tt.url)
+		if (err != nil) != tt.wantErr {
+			t.Errorf("ParseSpotifyURL(%q) error = %v, wantErr %v", tt.url, err, tt.wantErr)
+			continue
+		}
+		if urlType != tt.wantType || id != tt.wantID {
+			t.Errorf("ParseSpotifyURL(%q) = %q, %q, want %q, %q", tt.url, urlType, id, tt.wantType, tt.wantID)
+		}
+	}
+}
+
+func TestRetryDelay(t *testing.T) {
+	tests := []struct {
+		name       string
+		retryAfter string
+		attempt    int
+		minWait    time.Duration
+		maxWait    time.Duration
+	}{
+		{"Retry-After honoured", "3", 0, 3 * time.Second, 3 * time.Second},
+		{"Retry-After capped", "120", 0, maxRetryWait, maxRetryWait},
+		{"First backoff jittered", "", 0, 500 * time.Millisecond, time.Second},
+		{"Backoff grows", "", 2, 2 * time.Second, 4 * time.Second},
+		{"Backoff capped", "bogus", 10, maxRetryWait / 2, maxRetryWait},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			wait := retryDelay(tt.retryAfter, tt.attempt)
+			if wait < tt.minWait || wait > tt.maxWait {
+				t.Errorf("retryDelay(%q, %d) = %v, expected between %v and %v", tt.retryAfter, tt.attempt, wait, tt.minWait, tt.maxWait)
+			}
+		})
+	}
+}
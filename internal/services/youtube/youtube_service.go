@@ -1,11 +1,16 @@
 package youtube
 
 import (
+	"bytes"
 	"encoding/json"
 	"errors"
 	"fmt"
+	"io/fs"
 	"os/exec"
+	"strconv"
 	"strings"
+	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/vuongmanhnghia/discord-music-bot/internal/domain/valueobjects"
@@ -23,18 +28,19 @@ var (
 )
 
 // YouTubeInfo represents extracted video information from yt-dlp
-// Supports YouTube, SoundCloud, and other platforms
+// Supports YouTube, SoundCloud, and other platforms. Only the fields the bot uses
+// are declared, so the decoder skips yt-dlp's large format and thumbnail lists.
 type YouTubeInfo struct {
-	ID         string        `json:"id"`
-	Title      string        `json:"title"`
-	Duration   float64       `json:"duration"` // Changed to float64 for SoundCloud compatibility
-	Uploader   string        `json:"uploader"`
-	Thumbnail  string        `json:"thumbnail"`
-	WebpageURL string        `json:"webpage_url"`
-	StreamURL  string        `json:"url,omitempty"`
-	Formats    []Format      `json:"formats,omitempty"`
-	Entries    []YouTubeInfo `json:"entries,omitempty"` // For playlists
-	Type       string        `json:"_type,omitempty"`   // "video", "playlist", etc
+	ID          string        `json:"id"`
+	Title       string        `json:"title"`
+	Duration    float64       `json:"duration"` // Changed to float64 for SoundCloud compatibility
+	Uploader    string        `json:"uploader"`
+	Thumbnail   string        `json:"thumbnail"`
+	WebpageURL  string        `json:"webpage_url"`
+	OriginalURL string        `json:"original_url,omitempty"` // URL as passed to yt-dlp
+	StreamURL   string        `json:"url,omitempty"`
+	Entries     []YouTubeInfo `json:"entries,omitempty"` // For playlists
+	Type        string        `json:"_type,omitempty"`   // "video", "playlist", etc
 }
 
 // IsPlaylist checks if this is a playlist
@@ -42,25 +48,51 @@ func (info *YouTubeInfo) IsPlaylist() bool {
 	return info.Type == "playlist"
 }
 
-// Format represents an available stream format
-type Format struct {
-	FormatID   string  `json:"format_id"`
-	Ext        string  `json:"ext"`
-	URL        string  `json:"url"`
-	AudioCodec string  `json:"acodec"`
-	Quality    float64 `json:"quality"` // Can be float like 2.0
-	ABR        float64 `json:"abr"`     // Audio bitrate
-}
-
 // Service handles YouTube operations
 type Service struct {
 	cache       *utils.SmartCache
+	playlists   *utils.SmartCache // playlist entries by playlist ID, kept longer than cache
 	logger      *logger.Logger
 	ytDlpPath   string
 	cleanupStop chan struct{}
 	cleanupDone chan struct{}
+	closeOnce   sync.Once     // Close may be called more than once
+	procSlots   chan struct{} // bounds concurrent yt-dlp processes
+	pauseUntil  atomic.Int64  // UnixNano before which no yt-dlp process starts, set on HTTP 429
+	inflight    map[string]*extractCall
+	inflightMu  sync.Mutex
+	sleepReqs   time.Duration // pause between yt-dlp's HTTP requests on bulk extractions
+}
+
+// extractCall is an ExtractInfo run that concurrent callers for the same URL wait on
+type extractCall struct {
+	done chan struct{} // closed once info and err are set
+	info *YouTubeInfo
+	err  error
 }
 
+const (
+	// watchURLPrefix is the canonical URL of a YouTube video, completed by its ID
+	watchURLPrefix = "https://www.youtube.com/watch?v="
+	// videoIDLength is the length of every YouTube video ID
+	videoIDLength = 11
+)
+
+// rateLimitPause is how long all yt-dlp calls hold off after YouTube rate limits one of them
+const rateLimitPause = 30 * time.Second
+
+// maxConcurrentYtDlp bounds how many yt-dlp processes run at once, so bursts of
+// playlist loads and searches queue up instead of flooding YouTube with requests
+const maxConcurrentYtDlp = 4
+
+const (
+	// playlistCacheSize is how many extracted playlists are kept
+	playlistCacheSize = 50
+	// playlistCacheTTL is how long an extracted playlist is reused; entry lists
+	// change rarely and carry no expiring stream URLs
+	playlistCacheTTL = time.Hour
+)
+
 // NewService creates a new YouTube service
 func NewService(log *logger.Logger) (*Service, error) {
 	// Check if yt-dlp is available
@@ -76,10 +108,12 @@ func NewService(log *logger.Logger) (*Service, error) {
 
 	svc := &Service{
 		cache:       cache,
+		playlists:   utils.NewSmartCache(playlistCacheSize, playlistCacheTTL),
 		logger:      log,
 		ytDlpPath:   ytDlpPath,
 		cleanupStop: make(chan struct{}),
 		cleanupDone: make(chan struct{}),
+		procSlots:   make(chan struct{}, maxConcurrentYtDlp),
 	}
 
 	// Start cache cleanup worker to prevent memory leaks
@@ -91,28 +125,41 @@ func NewService(log *logger.Logger) (*Service, error) {
 // ExtractInfo extracts video/playlist information from URL
 func (s *Service) ExtractInfo(url string) (*YouTubeInfo, error) {
 	// Check cache first
-	if cached, ok := s.cache.Get(url); ok {
+	key := infoCacheKey(url)
+	if cached, ok := s.cache.Get(key); ok {
 		s.logger.Debug("Cache hit for URL")
 		return cached.(*YouTubeInfo), nil
 	}
 
-	s.logger.WithField("url", url).Info("Extracting video info...")
-
-	// Build yt-dlp command
-	args := []string{
-		"--dump-json",
-		"--no-playlist", // Handle playlists separately
-		"--format", "bestaudio/best",
-		"--no-check-certificate",
-		"--geo-bypass",
-		"--no-warnings", // Suppress warnings that break JSON parsing
-		url,
+	// Callers asking for a URL that is already being extracted share that result
+	s.inflightMu.Lock()
+	if call, ok := s.inflight[key]; ok {
+		s.inflightMu.Unlock()
+		<-call.done
+		return call.info, call.err
 	}
+	if s.inflight == nil {
+		s.inflight = make(map[string]*extractCall)
+	}
+	call := &extractCall{done: make(chan struct{})}
+	s.inflight[key] = call
+	s.inflightMu.Unlock()
+
+	call.info, call.err = s.extractInfo(url, key)
 
-	cmd := exec.Command(s.ytDlpPath, args...)
+	s.inflightMu.Lock()
+	delete(s.inflight, key)
+	s.inflightMu.Unlock()
+	close(call.done)
+
+	return call.info, call.err
+}
 
-	// Capture both stdout and stderr
-	output, err := cmd.Output()
+// extractInfo runs yt-dlp for a single URL and caches the result under key
+func (s *Service) extractInfo(url, key string) (*YouTubeInfo, error) {
+	s.logger.WithField("url", url).Info("Extracting video info...")
+
+	output, err := s.runYtDlp(extractInfoArgs(url))
 	if err != nil {
 		// Try to get stderr if available
 		if exitErr, ok := err.(*exec.ExitError); ok {
@@ -127,7 +174,7 @@ func (s *Service) ExtractInfo(url string) (*YouTubeInfo, error) {
 	}
 
 	// Find JSON start (skip any non-JSON output)
-	jsonStart := strings.Index(string(output), "{")
+	jsonStart := bytes.IndexByte(output, '{')
 	if jsonStart == -1 {
 		s.logger.Error("No JSON found in yt-dlp output")
 		return nil, fmt.Errorf("%w: no JSON in output", ErrExtractionFailed)
@@ -141,7 +188,7 @@ func (s *Service) ExtractInfo(url string) (*YouTubeInfo, error) {
 	}
 
 	// Cache the result
-	s.cache.Set(url, &info)
+	s.cache.Set(key, &info)
 
 	s.logger.WithFields(map[string]interface{}{
 		"title":    info.Title,
@@ -151,8 +198,119 @@ func (s *Service) ExtractInfo(url string) (*YouTubeInfo, error) {
 	return &info, nil
 }
 
+// PrefetchInfo extracts several URLs with a few concurrent yt-dlp runs and caches
+// the results, so the ExtractInfo calls that follow are served from the cache.
+// It returns how many URLs were extracted; failed URLs are left for ExtractInfo
+// to retry and report individually.
+func (s *Service) PrefetchInfo(urls []string) int {
+	pending := make(map[string]bool, len(urls))
+	missing := make([]string, 0, len(urls))
+	for _, url := range urls {
+		key := infoCacheKey(url)
+		if pending[key] {
+			continue
+		}
+		if _, ok := s.cache.Get(key); ok {
+			continue
+		}
+		pending[key] = true
+		missing = append(missing, url)
+	}
+	if len(missing) < 2 {
+		return 0 // Nothing to amortize over a plain ExtractInfo
+	}
+
+	// Split the URLs across concurrent runs of at least two URLs each, so their
+	// network round trips overlap while process startup stays amortized;
+	// runYtDlp's slots keep the total number of processes bounded
+	runs := min(maxConcurrentYtDlp, len(missing)/2)
+
+	s.logger.WithFields(map[string]interface{}{
+		"count": len(missing),
+		"runs":  runs,
+	}).Info("Extracting video info in batch...")
+
+	outputs := make([][]byte, runs)
+	var wg sync.WaitGroup
+	for i := range outputs {
+		group := missing[i*len(missing)/runs : (i+1)*len(missing)/runs]
+		wg.Add(1)
+		go func(i int, group []string) {
+			defer wg.Done()
+			// yt-dlp moves on to the next URL after a failure and exits non-zero at the end,
+			// so the output of a failed run still holds every URL that succeeded
+			output, err := s.runYtDlp(s.withRequestSleep(extractInfoArgs(group...)))
+			if err != nil {
+				s.logger.WithError(err).Debug("Batch extraction had failures")
+			}
+			outputs[i] = output
+		}(i, group)
+	}
+	wg.Wait()
+
+	extracted := 0
+	for _, line := range bytes.Split(bytes.Join(outputs, []byte{'\n'}), []byte{'\n'}) {
+		line = bytes.TrimSpace(line)
+		if len(line) == 0 || line[0] != '{' {
+			continue // Skip non-JSON lines
+		}
+
+		info := &YouTubeInfo{}
+		if err := json.Unmarshal(line, info); err != nil {
+			s.logger.WithError(err).Warn("Failed to parse batch entry")
+			continue
+		}
+		key := infoCacheKey(info.OriginalURL)
+		if !pending[key] {
+			continue
+		}
+		delete(pending, key)
+
+		s.cache.Set(key, info)
+		extracted++
+	}
+
+	return extracted
+}
+
+// extractInfoArgs builds the yt-dlp arguments for extracting single videos
+func extractInfoArgs(urls ...string) []string {
+	args := []string{
+		"--dump-json",
+		"--no-playlist", // Handle playlists separately
+		"--format", "bestaudio/best",
+		"--no-check-certificate",
+		"--geo-bypass",
+		"--no-warnings", // Suppress warnings that break JSON parsing
+	}
+	return append(args, urls...)
+}
+
+// SetRequestSleep makes bulk extractions (batch prefetches and playlists) pause
+// for d between yt-dlp's HTTP requests; zero disables the pause. Spacing out
+// sustained request bursts keeps YouTube from answering with 403s and 429s.
+// It must be called before the service is used.
+func (s *Service) SetRequestSleep(d time.Duration) {
+	s.sleepReqs = d
+}
+
+// withRequestSleep prepends the configured request pause to the yt-dlp args
+func (s *Service) withRequestSleep(args []string) []string {
+	if s.sleepReqs <= 0 {
+		return args
+	}
+	seconds := strconv.FormatFloat(s.sleepReqs.Seconds(), 'f', -1, 64)
+	return append([]string{"--sleep-requests", seconds}, args...)
+}
+
 // ExtractPlaylist extracts all videos from a playlist
 func (s *Service) ExtractPlaylist(url string) ([]YouTubeInfo, error) {
+	key := playlistCacheKey(url)
+	if cached, ok := s.playlists.Get(key); ok {
+		s.logger.WithField("url", url).Debug("Cache hit for playlist")
+		return cached.([]YouTubeInfo), nil
+	}
+
 	s.logger.WithField("url", url).Info("Extracting playlist...")
 
 	// Build yt-dlp command for playlist
@@ -165,8 +323,7 @@ func (s *Service) ExtractPlaylist(url string) ([]YouTubeInfo, error) {
 		url,
 	}
 
-	cmd := exec.Command(s.ytDlpPath, args...)
-	output, err := cmd.Output()
+	output, err := s.runYtDlp(s.withRequestSleep(args))
 	if err != nil {
 		if exitErr, ok := err.(*exec.ExitError); ok {
 			s.logger.WithFields(map[string]interface{}{
@@ -181,39 +338,78 @@ func (s *Service) ExtractPlaylist(url string) ([]YouTubeInfo, error) {
 
 	// Parse multiple JSON objects (one per line)
 	var videos []YouTubeInfo
-	lines := strings.Split(string(output), "\n")
-	for _, line := range lines {
-		line = strings.TrimSpace(line)
-		if line == "" || !strings.HasPrefix(line, "{") {
+	for _, line := range bytes.Split(output, []byte{'\n'}) {
+		line = bytes.TrimSpace(line)
+		if len(line) == 0 || line[0] != '{' {
 			continue // Skip non-JSON lines
 		}
 
 		var info YouTubeInfo
-		if err := json.Unmarshal([]byte(line), &info); err != nil {
+		if err := json.Unmarshal(line, &info); err != nil {
 			s.logger.WithError(err).Warn("Failed to parse playlist entry")
 			continue
 		}
 		videos = append(videos, info)
 	}
 
+	s.playlists.Set(key, videos)
+
 	s.logger.WithField("count", len(videos)).Info("✅ Successfully extracted playlist")
 	return videos, nil
 }
 
+// playlistCacheKey returns the cache key for a playlist URL: its list ID when it
+// has one, so the same playlist shared with different extra parameters matches
+func playlistCacheKey(url string) string {
+	id := queryParam(url, "list")
+	if id == "" {
+		return url
+	}
+	return "list:" + id
+}
+
+// queryParam returns the raw value of the first name= parameter in url's query,
+// or "" when there is none. It slices the string instead of parsing the URL.
+func queryParam(url, name string) string {
+	_, query, ok := strings.Cut(url, "?")
+	if !ok {
+		return ""
+	}
+	query, _, _ = strings.Cut(query, "#")
+
+	for query != "" {
+		var param string
+		param, query, _ = strings.Cut(query, "&")
+		if value, ok := strings.CutPrefix(param, name+"="); ok {
+			return value
+		}
+	}
+	return ""
+}
+
 // Search searches YouTube and returns top results
 func (s *Service) Search(query string, maxResults int) ([]YouTubeInfo, error) {
 	if maxResults <= 0 {
 		maxResults = 5
 	}
 
+	// Build search URL; it also keys the cache
+	searchURL := "ytsearch" + strconv.Itoa(maxResults) + ":" + query
+
+	// Check cache first; an empty result is cached too, so a query with no
+	// matches isn't searched again until it expires
+	if cached, ok := s.cache.Get(searchURL); ok {
+		if videos, ok := cached.([]YouTubeInfo); ok {
+			s.logger.Debug("Cache hit for search")
+			return videos, nil
+		}
+	}
+
 	s.logger.WithFields(map[string]interface{}{
 		"query":      query,
 		"maxResults": maxResults,
 	}).Info("Searching YouTube...")
 
-	// Build search URL
-	searchURL := fmt.Sprintf("ytsearch%d:%s", maxResults, query)
-
 	args := []string{
 		"--dump-json",
 		"--no-check-certificate",
@@ -222,8 +418,7 @@ func (s *Service) Search(query string, maxResults int) ([]YouTubeInfo, error) {
 		searchURL,
 	}
 
-	cmd := exec.Command(s.ytDlpPath, args...)
-	output, err := cmd.Output() // Use Output() instead of CombinedOutput()
+	output, err := s.runYtDlp(args)
 	if err != nil {
 		s.logger.WithError(err).Error("Search failed")
 		return nil, fmt.Errorf("search failed: %w", err)
@@ -231,21 +426,22 @@ func (s *Service) Search(query string, maxResults int) ([]YouTubeInfo, error) {
 
 	// Parse results
 	var videos []YouTubeInfo
-	lines := strings.Split(string(output), "\n")
-	for _, line := range lines {
-		line = strings.TrimSpace(line)
-		if line == "" || !strings.HasPrefix(line, "{") {
+	for _, line := range bytes.Split(output, []byte{'\n'}) {
+		line = bytes.TrimSpace(line)
+		if len(line) == 0 || line[0] != '{' {
 			continue // Skip non-JSON lines
 		}
 
 		var info YouTubeInfo
-		if err := json.Unmarshal([]byte(line), &info); err != nil {
+		if err := json.Unmarshal(line, &info); err != nil {
 			s.logger.WithError(err).Warn("Failed to parse search result")
 			continue
 		}
 		videos = append(videos, info)
 	}
 
+	s.cache.Set(searchURL, videos)
+
 	s.logger.WithField("results", len(videos)).Info("✅ Search completed")
 	return videos, nil
 }
@@ -257,11 +453,24 @@ func (s *Service) SearchByISRC(isrc string) (*YouTubeInfo, error) {
 		return nil, fmt.Errorf("ISRC is empty")
 	}
 
-	s.logger.WithField("isrc", isrc).Info("Searching YouTube by ISRC...")
-
 	// Search for ISRC on YouTube
 	// Many official uploads include ISRC in metadata
-	searchQuery := fmt.Sprintf("ytsearch1:%s", isrc)
+	searchQuery := "ytsearch1:" + isrc
+
+	// Check cache first; a nil entry records that the ISRC had no match. The key has
+	// its own prefix so it never collides with a text search for the same string
+	cacheKey := "isrc:" + isrc
+	if cached, ok := s.cache.Get(cacheKey); ok {
+		if info, ok := cached.(*YouTubeInfo); ok {
+			s.logger.Debug("Cache hit for ISRC search")
+			if info != nil {
+				return info, nil
+			}
+			return nil, fmt.Errorf("no results found for ISRC: %s", isrc)
+		}
+	}
+
+	s.logger.WithField("isrc", isrc).Info("Searching YouTube by ISRC...")
 
 	args := []string{
 		"--dump-json",
@@ -271,37 +480,38 @@ func (s *Service) SearchByISRC(isrc string) (*YouTubeInfo, error) {
 		searchQuery,
 	}
 
-	cmd := exec.Command(s.ytDlpPath, args...)
-	output, err := cmd.Output()
+	output, err := s.runYtDlp(args)
 	if err != nil {
 		s.logger.WithError(err).Debug("ISRC search failed")
 		return nil, fmt.Errorf("ISRC search failed: %w", err)
 	}
 
 	// Parse result
-	lines := strings.Split(string(output), "\n")
-	for _, line := range lines {
-		line = strings.TrimSpace(line)
-		if line == "" || !strings.HasPrefix(line, "{") {
+	for _, line := range bytes.Split(output, []byte{'\n'}) {
+		line = bytes.TrimSpace(line)
+		if len(line) == 0 || line[0] != '{' {
 			continue
 		}
 
 		var info YouTubeInfo
-		if err := json.Unmarshal([]byte(line), &info); err != nil {
+		if err := json.Unmarshal(line, &info); err != nil {
 			continue
 		}
 
+		s.cache.Set(cacheKey, &info)
+
 		s.logger.WithField("title", info.Title).Info("✅ Found video by ISRC")
 		return &info, nil
 	}
 
+	s.cache.Set(cacheKey, (*YouTubeInfo)(nil))
 	return nil, fmt.Errorf("no results found for ISRC: %s", isrc)
 }
 
 // GetStreamURL gets the best audio stream URL for a video
 func (s *Service) GetStreamURL(videoID string) (string, error) {
-	// Check cache first
-	cacheKey := fmt.Sprintf("stream:%s", videoID)
+	// Check cache first; keys are built by concatenation since every lookup needs one
+	cacheKey := "stream:" + videoID
 	if cached, ok := s.cache.Get(cacheKey); ok {
 		s.logger.Debug("Cache hit for stream URL")
 		return cached.(string), nil
@@ -314,7 +524,7 @@ func (s *Service) GetStreamURL(videoID string) (string, error) {
 		videoURL = videoID
 	} else {
 		// YouTube video ID, construct URL
-		videoURL = fmt.Sprintf("https://www.youtube.com/watch?v=%s", videoID)
+		videoURL = VideoURL(videoID)
 	}
 
 	args := []string{
@@ -326,8 +536,7 @@ func (s *Service) GetStreamURL(videoID string) (string, error) {
 		videoURL,
 	}
 
-	cmd := exec.Command(s.ytDlpPath, args...)
-	output, err := cmd.Output() // Use Output() instead of CombinedOutput()
+	output, err := s.runYtDlp(args)
 	if err != nil {
 		s.logger.WithError(err).Error("Failed to get stream URL")
 		return "", fmt.Errorf("failed to get stream URL: %w", err)
@@ -344,6 +553,40 @@ func (s *Service) GetStreamURL(videoID string) (string, error) {
 	return streamURL, nil
 }
 
+// runYtDlp runs yt-dlp with args and returns its stdout, waiting for a free
+// process slot first. Once YouTube rate limits a call, every call waits out
+// rateLimitPause instead of adding to the requests being rejected.
+func (s *Service) runYtDlp(args []string) ([]byte, error) {
+	// The pause is checked after taking a slot, so callers that were queued for a
+	// slot when a 429 arrived wait it out too; the slot is not held while sleeping
+	for {
+		s.procSlots <- struct{}{}
+		wait := time.Until(time.Unix(0, s.pauseUntil.Load()))
+		if wait <= 0 {
+			break
+		}
+		<-s.procSlots
+		s.logger.WithField("wait", wait.String()).Debug("Waiting out YouTube rate limit")
+		time.Sleep(wait)
+	}
+	defer func() { <-s.procSlots }()
+
+	output, err := exec.Command(s.ytDlpPath, args...).Output()
+
+	var exitErr *exec.ExitError
+	if errors.As(err, &exitErr) && isRateLimited(exitErr.Stderr) {
+		s.pauseUntil.Store(time.Now().Add(rateLimitPause).UnixNano())
+		s.logger.WithField("pause", rateLimitPause.String()).Warn("⚠️ YouTube rate limit hit, pausing yt-dlp calls")
+	}
+
+	return output, err
+}
+
+// isRateLimited reports whether yt-dlp's stderr shows an HTTP 429 response
+func isRateLimited(stderr []byte) bool {
+	return bytes.Contains(stderr, []byte("HTTP Error 429")) || bytes.Contains(stderr, []byte("Too Many Requests"))
+}
+
 // IsPlaylistURL checks if URL is a playlist
 // Only returns true for actual playlist URLs like /playlist?list=...
 // Returns false for video URLs with list parameter like /watch?v=...&list=...
@@ -351,7 +594,17 @@ func IsPlaylistURL(url string) bool {
 	// Only match actual playlist URLs, not video URLs with list parameter
 	// Playlist URLs have the format: youtube.com/playlist?list=...
 	// Video URLs with list are: youtube.com/watch?v=...&list=... or similar (which we want to ignore)
-	return strings.Contains(url, "/playlist?list=") || strings.Contains(url, "/playlist") && strings.Contains(url, "list=")
+	// "/playlist?list=" is covered by the general check, so non-playlist URLs are scanned once
+	return strings.Contains(url, "/playlist") && strings.Contains(url, "list=")
+}
+
+// IsPermanentError reports whether a yt-dlp failure will repeat on every call
+// (binary missing or not executable), so trying another query is pointless
+func IsPermanentError(err error) bool {
+	return errors.Is(err, ErrYtDlpNotFound) ||
+		errors.Is(err, exec.ErrNotFound) ||
+		errors.Is(err, fs.ErrNotExist) ||
+		errors.Is(err, fs.ErrPermission)
 }
 
 // IsYouTubeURL checks if URL is a valid YouTube URL
@@ -359,6 +612,53 @@ func IsYouTubeURL(url string) bool {
 	return strings.Contains(url, "youtube.com") || strings.Contains(url, "youtu.be")
 }
 
+// VideoURL returns the canonical watch URL for a YouTube video ID
+func VideoURL(videoID string) string {
+	return watchURLPrefix + videoID
+}
+
+// infoCacheKey returns the cache key for a URL's extracted info. YouTube links
+// to the same video (youtu.be, shorts, extra query parameters) share one key, so
+// a video found by search is not extracted again when pasted in another form.
+func infoCacheKey(url string) string {
+	if id := youtubeVideoID(url); id != "" {
+		return VideoURL(id)
+	}
+	return url
+}
+
+// youtubeVideoID returns the video ID in a YouTube video URL, or "" if there is none
+func youtubeVideoID(url string) string {
+	var rest string
+	if i := strings.Index(url, "youtu.be/"); i >= 0 {
+		rest = url[i+len("youtu.be/"):]
+	} else if !strings.Contains(url, "youtube.com/") {
+		return ""
+	} else if i := strings.Index(url, "/shorts/"); i >= 0 {
+		rest = url[i+len("/shorts/"):]
+	} else if i := strings.Index(url, "?v="); i >= 0 {
+		rest = url[i+len("?v="):]
+	} else if i := strings.Index(url, "&v="); i >= 0 {
+		rest = url[i+len("&v="):]
+	} else {
+		return ""
+	}
+
+	if end := strings.IndexAny(rest, "?&#/"); end >= 0 {
+		rest = rest[:end]
+	}
+	if len(rest) != videoIDLength {
+		return ""
+	}
+	for i := 0; i < len(rest); i++ {
+		c := rest[i]
+		if !(c >= 'a' && c <= 'z' || c >= 'A' && c <= 'Z' || c >= '0' && c <= '9' || c == '-' || c == '_') {
+			return ""
+		}
+	}
+	return rest
+}
+
 // ToSongMetadata converts YouTubeInfo to SongMetadata
 func (info *YouTubeInfo) ToSongMetadata() *valueobjects.SongMetadata {
 	return &valueobjects.SongMetadata{
@@ -377,6 +677,7 @@ func (s *Service) CacheStats() (hits, misses, evictions int64, size int) {
 // ClearCache clears the entire cache
 func (s *Service) ClearCache() {
 	s.cache.Clear()
+	s.playlists.Clear()
 	s.logger.Info("Cache cleared")
 }
 
@@ -384,16 +685,18 @@ func (s *Service) ClearCache() {
 func (s *Service) startCacheCleanup() {
 	defer close(s.cleanupDone)
 
-	ticker := time.NewTicker(1 * time.Minute)
-	defer ticker.Stop()
+	// Wake when the earliest entry expires, but at least once a minute
+	timer := time.NewTimer(s.cache.NextCleanupIn(time.Minute))
+	defer timer.Stop()
 
 	for {
 		select {
-		case <-ticker.C:
-			removed := s.cache.CleanupExpired()
+		case <-timer.C:
+			removed := s.cache.CleanupExpired() + s.playlists.CleanupExpired()
 			if removed > 0 {
 				s.logger.WithField("removed", removed).Debug("Cleaned up expired cache entries")
 			}
+			timer.Reset(s.cache.NextCleanupIn(time.Minute))
 		case <-s.cleanupStop:
 			s.logger.Debug("Cache cleanup worker stopped")
 			return
@@ -401,9 +704,11 @@ func (s *Service) startCacheCleanup() {
 	}
 }
 
-// Close stops the cleanup worker and releases resources
+// Close stops the cleanup worker and releases resources; later calls are no-ops
 func (s *Service) Close() {
-	close(s.cleanupStop)
-	<-s.cleanupDone
-	s.logger.Info("YouTube service closed")
+	s.closeOnce.Do(func() {
+		close(s.cleanupStop)
+		<-s.cleanupDone
+		s.logger.Info("YouTube service closed")
+	})
 }
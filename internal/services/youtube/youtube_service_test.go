@@ -1,8 +1,17 @@
 package youtube
 
 import (
+	"fmt"
+	"io/fs"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"strings"
+	"sync"
 	"testing"
+	"time"
 
+	"github.com/vuongmanhnghia/discord-music-bot/internal/utils"
 	"github.com/vuongmanhnghia/discord-music-bot/pkg/logger"
 )
 
@@ -92,6 +101,70 @@ func TestIsPlaylistURL(t *testing.T) {
 	}
 }
 
+func TestInfoCacheKey(t *testing.T) {
+	const canonical = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+	tests := []struct {
+		url      string
+		expected string
+	}{
+		{canonical, canonical},
+		{"https://youtu.be/dQw4w9WgXcQ?si=abc", canonical},
+		{"https://www.youtube.com/watch?list=PL1&v=dQw4w9WgXcQ&t=42", canonical},
+		{"https://youtube.com/shorts/dQw4w9WgXcQ", canonical},
+		{"https://music.youtube.com/watch?v=dQw4w9WgXcQ&feature=share", canonical},
+		{"https://www.youtube.com/playlist?list=PLtest", "https://www.youtube.com/playlist?list=PLtest"},
+		{"https://www.youtube.com/watch?v=short", "https://www.youtube.com/watch?v=short"},
+		{"https://soundcloud.com/artist/track?v=dQw4w9WgXcQ", "https://soundcloud.com/artist/track?v=dQw4w9WgXcQ"},
+	}
+
+	for _, tt := range tests {
+		if got := infoCacheKey(tt.url); got != tt.expected {
+			t.Errorf("infoCacheKey(%q) = %q, expected %q", tt.url, got, tt.expected)
+		}
+	}
+}
+
+func TestPlaylistCacheKey(t *testing.T) {
+	tests := []struct {
+		url      string
+		expected string
+	}{
+		{"https://www.youtube.com/playlist?list=PLtest", "list:PLtest"},
+		{"https://www.youtube.com/playlist?si=abc&list=PLtest#top", "list:PLtest"},
+		{"https://music.youtube.com/playlist?list=PLtest&feature=share", "list:PLtest"},
+		{"https://example.com/media?playlist=PLtest", "https://example.com/media?playlist=PLtest"},
+		{"https://soundcloud.com/artist/sets/mix", "https://soundcloud.com/artist/sets/mix"},
+	}
+
+	for _, tt := range tests {
+		if got := playlistCacheKey(tt.url); got != tt.expected {
+			t.Errorf("playlistCacheKey(%q) = %q, expected %q", tt.url, got, tt.expected)
+		}
+	}
+}
+
+func TestIsPermanentError(t *testing.T) {
+	tests := []struct {
+		name     string
+		err      error
+		expected bool
+	}{
+		{"No error", nil, false},
+		{"yt-dlp missing", ErrYtDlpNotFound, true},
+		{"Binary not in PATH", fmt.Errorf("search failed: %w", exec.ErrNotFound), true},
+		{"Binary path gone", fmt.Errorf("search failed: %w", &fs.PathError{Op: "fork/exec", Path: "/usr/bin/yt-dlp", Err: fs.ErrNotExist}), true},
+		{"Extraction failure", fmt.Errorf("search failed: %w", ErrExtractionFailed), false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := IsPermanentError(tt.err); got != tt.expected {
+				t.Errorf("IsPermanentError(%v) = %v, expected %v", tt.err, got, tt.expected)
+			}
+		})
+	}
+}
+
 func TestToSongMetadata(t *testing.T) {
 	info := &YouTubeInfo{
 		ID:         "dQw4w9WgXcQ",
@@ -145,6 +218,249 @@ func TestServiceCacheOperations(t *testing.T) {
 	}
 }
 
+func TestSearchNegativeCache(t *testing.T) {
+	// A missing yt-dlp path makes any cache miss fail, so success proves the cache answered
+	svc := newTestService(t, "/nonexistent/yt-dlp", 1)
+
+	svc.cache.Set("ytsearch3:no such song", []YouTubeInfo(nil))
+	results, err := svc.Search("no such song", 3)
+	if err != nil {
+		t.Fatalf("Expected cached empty result, got error: %v", err)
+	}
+	if len(results) != 0 {
+		t.Errorf("Expected no results, got %d", len(results))
+	}
+
+	svc.cache.Set("isrc:USRC17607839", (*YouTubeInfo)(nil))
+	info, err := svc.SearchByISRC("USRC17607839")
+	if err == nil || info != nil {
+		t.Errorf("Expected cached ISRC miss to return an error, got %v, %v", info, err)
+	}
+	if IsPermanentError(err) {
+		t.Errorf("Cached ISRC miss should not run yt-dlp, got %v", err)
+	}
+}
+
+func TestSearchAndISRCCacheSeparately(t *testing.T) {
+	script, _ := fakeYtDlp(t, "echo '{\"id\":\"a\",\"title\":\"A\"}'\n")
+
+	const query = "USRC17607839"
+	search := func(t *testing.T, svc *Service) {
+		results, err := svc.Search(query, 1)
+		if err != nil || len(results) != 1 || results[0].ID != "a" {
+			t.Errorf("Search() = %+v, %v", results, err)
+		}
+	}
+	searchISRC := func(t *testing.T, svc *Service) {
+		info, err := svc.SearchByISRC(query)
+		if err != nil || info.ID != "a" {
+			t.Errorf("SearchByISRC() = %+v, %v", info, err)
+		}
+	}
+
+	// Each order must serve both lookups, including from the cache, without panicking
+	for name, calls := range map[string][]func(*testing.T, *Service){
+		"search first": {search, searchISRC},
+		"isrc first":   {searchISRC, search},
+	} {
+		t.Run(name, func(t *testing.T) {
+			svc := newTestService(t, script, 1)
+			for _, call := range append(calls, calls...) {
+				call(t, svc)
+			}
+		})
+	}
+}
+
+func TestServiceCloseIsIdempotent(t *testing.T) {
+	svc := &Service{
+		cache:       utils.NewSmartCache(10, time.Minute),
+		logger:      logger.New(logger.Config{Level: "error"}),
+		cleanupStop: make(chan struct{}),
+		cleanupDone: make(chan struct{}),
+	}
+	go svc.startCacheCleanup()
+
+	svc.Close()
+	svc.Close() // Must not panic on the already closed stop channel
+}
+
+func TestPrefetchInfo(t *testing.T) {
+	// Fake yt-dlp: the first URL fails, the second succeeds, and the run exits non-zero
+	script, _ := fakeYtDlp(t, "echo 'ERROR: video unavailable' >&2\n"+
+		"echo '{\"id\":\"b\",\"title\":\"B\",\"url\":\"https://stream/b\",\"original_url\":\"https://x/b\"}'\n"+
+		"exit 1\n")
+	svc := newTestService(t, script, 1)
+
+	if n := svc.PrefetchInfo([]string{"https://x/a", "https://x/b", "https://x/b"}); n != 1 {
+		t.Fatalf("Expected 1 prefetched URL, got %d", n)
+	}
+	if _, ok := svc.cache.Get("https://x/a"); ok {
+		t.Error("Failed URL should not be cached")
+	}
+	info, err := svc.ExtractInfo("https://x/b")
+	if err != nil {
+		t.Fatalf("Expected cached info, got error: %v", err)
+	}
+	if info.Title != "B" || info.StreamURL != "https://stream/b" {
+		t.Errorf("Unexpected cached info: %+v", info)
+	}
+}
+
+func TestPrefetchInfoSplitsRuns(t *testing.T) {
+	// Fake yt-dlp that echoes an entry for every URL it is given
+	script, runs := fakeYtDlp(t, "for arg; do case $arg in https://*) "+
+		"echo \"{\\\"id\\\":\\\"v\\\",\\\"original_url\\\":\\\"$arg\\\"}\";; esac; done\n")
+	svc := newTestService(t, script, 4)
+
+	urls := []string{"https://x/a", "https://x/b", "https://x/c", "https://x/d", "https://x/e"}
+	if n := svc.PrefetchInfo(urls); n != len(urls) {
+		t.Fatalf("Expected %d prefetched URLs, got %d", len(urls), n)
+	}
+	if n := countRuns(t, runs); n != 2 {
+		t.Errorf("Expected 2 yt-dlp runs, got %d", n)
+	}
+}
+
+func TestWithRequestSleep(t *testing.T) {
+	tests := []struct {
+		sleep time.Duration
+		want  string
+	}{
+		{0, "--dump-json"},
+		{time.Second, "--sleep-requests 1 --dump-json"},
+		{1500 * time.Millisecond, "--sleep-requests 1.5 --dump-json"},
+	}
+
+	for _, tt := range tests {
+		svc := &Service{}
+		svc.SetRequestSleep(tt.sleep)
+		if got := strings.Join(svc.withRequestSleep([]string{"--dump-json"}), " "); got != tt.want {
+			t.Errorf("withRequestSleep() with %v = %q, want %q", tt.sleep, got, tt.want)
+		}
+	}
+}
+
+func TestRunYtDlpPausesAfterRateLimit(t *testing.T) {
+	script, _ := fakeYtDlp(t, "echo 'ERROR: HTTP Error 429: Too Many Requests' >&2\nexit 1\n")
+	svc := newTestService(t, script, 1)
+
+	if _, err := svc.runYtDlp(nil); err == nil {
+		t.Fatal("Expected yt-dlp failure")
+	}
+	pause := time.Until(time.Unix(0, svc.pauseUntil.Load()))
+	if pause <= 0 || pause > rateLimitPause {
+		t.Errorf("Expected a pause of up to %v, got %v", rateLimitPause, pause)
+	}
+
+	// A caller already queued for the slot when the pause starts must wait it out too
+	svc.pauseUntil.Store(0)
+	svc.procSlots <- struct{}{}
+	started := make(chan struct{})
+	done := make(chan time.Time)
+	go func() {
+		close(started)
+		svc.runYtDlp(nil)
+		done <- time.Now()
+	}()
+	<-started
+	time.Sleep(20 * time.Millisecond) // Let the caller block on the full slot
+	deadline := time.Now().Add(200 * time.Millisecond)
+	svc.pauseUntil.Store(deadline.UnixNano())
+	<-svc.procSlots
+
+	if finished := <-done; finished.Before(deadline) {
+		t.Errorf("Queued caller ran %v before the pause ended", deadline.Sub(finished))
+	}
+}
+
+func TestExtractInfoSharesInflightCall(t *testing.T) {
+	// Fake yt-dlp slow enough for the calls to overlap
+	script, runs := fakeYtDlp(t, "sleep 0.2\n"+
+		"echo '{\"id\":\"a\",\"title\":\"A\",\"url\":\"https://stream/a\"}'\n")
+	svc := newTestService(t, script, 4)
+
+	var wg sync.WaitGroup
+	for i := 0; i < 3; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			if info, err := svc.ExtractInfo("https://x/a"); err != nil || info.Title != "A" {
+				t.Errorf("Unexpected result: %v, %v", info, err)
+			}
+		}()
+	}
+	wg.Wait()
+
+	if n := countRuns(t, runs); n != 1 {
+		t.Errorf("Expected a single yt-dlp run, got %d", n)
+	}
+}
+
+func TestExtractPlaylist(t *testing.T) {
+	script, runs := fakeYtDlp(t, "echo '{\"id\":\"a\",\"title\":\"A\"}'\n"+
+		"echo 'not json'\n"+
+		"echo '{\"id\":\"b\",\"title\":\"B\"}'\n")
+	svc := newTestService(t, script, 1)
+
+	// The second URL names the same playlist, so it is served from the cache
+	for _, url := range []string{
+		"https://www.youtube.com/playlist?list=PLtest",
+		"https://www.youtube.com/playlist?list=PLtest&si=share",
+	} {
+		videos, err := svc.ExtractPlaylist(url)
+		if err != nil {
+			t.Fatalf("ExtractPlaylist(%s) failed: %v", url, err)
+		}
+		if len(videos) != 2 || videos[0].ID != "a" || videos[1].ID != "b" {
+			t.Errorf("Unexpected entries for %s: %+v", url, videos)
+		}
+	}
+
+	if n := countRuns(t, runs); n != 1 {
+		t.Errorf("Expected a single yt-dlp run, got %d", n)
+	}
+}
+
+// fakeYtDlp writes a shell script standing in for yt-dlp that runs body and
+// appends a line to runsFile on every run
+func fakeYtDlp(t *testing.T, body string) (script, runsFile string) {
+	t.Helper()
+	dir := t.TempDir()
+	runsFile = filepath.Join(dir, "runs")
+	script = filepath.Join(dir, "yt-dlp")
+	content := "#!/bin/sh\necho run >> " + runsFile + "\n" + body
+	if err := os.WriteFile(script, []byte(content), 0755); err != nil {
+		t.Fatal(err)
+	}
+	return script, runsFile
+}
+
+// newTestService returns a service that runs script as yt-dlp with slots process slots
+func newTestService(t *testing.T, script string, slots int) *Service {
+	t.Helper()
+	return &Service{
+		cache:     utils.NewSmartCache(10, time.Minute),
+		playlists: utils.NewSmartCache(10, time.Minute),
+		logger:    logger.New(logger.Config{Level: "error"}),
+		ytDlpPath: script,
+		procSlots: make(chan struct{}, slots),
+	}
+}
+
+// countRuns returns how many times the fake yt-dlp behind runsFile ran
+func countRuns(t *testing.T, runsFile string) int {
+	t.Helper()
+	data, err := os.ReadFile(runsFile)
+	if os.IsNotExist(err) {
+		return 0
+	}
+	if err != nil {
+		t.Fatal(err)
+	}
+	return strings.Count(string(data), "run")
+}
+
 // Integration tests (require yt-dlp and network)
 func TestExtractInfoIntegration(t *testing.T) {
 	if testing.Short() {
@@ -8,36 +8,77 @@ import (
 
 // CacheEntry represents an entry in the cache with TTL
 type CacheEntry struct {
-	Key        string
-	Value      interface{}
-	ExpiresAt  time.Time
-	accessTime time.Time
+	Key       string
+	Value     interface{}
+	ExpiresAt time.Time
+
+	expiryElem *list.Element // position in SmartCache.expiryList, nil without TTL
 }
 
 // IsExpired returns true if the entry has expired
 func (e *CacheEntry) IsExpired() bool {
-	return !e.ExpiresAt.IsZero() && time.Now().After(e.ExpiresAt)
+	// Entries without a TTL never expire, so skip reading the clock
+	if e.ExpiresAt.IsZero() {
+		return false
+	}
+	return e.expiredAt(time.Now())
+}
+
+// expiredAt reports whether the entry has expired at the given time.
+// Times from time.Now carry a monotonic reading, so TTLs are unaffected by wall-clock jumps.
+func (e *CacheEntry) expiredAt(now time.Time) bool {
+	return !e.ExpiresAt.IsZero() && now.After(e.ExpiresAt)
 }
 
 // SmartCache is an LRU cache with TTL support
 type SmartCache struct {
-	maxSize   int
-	ttl       time.Duration
-	items     map[string]*list.Element
-	lruList   *list.List
-	mu        sync.RWMutex
-	hits      int64
-	misses    int64
-	evictions int64
+	maxSize    int
+	ttl        time.Duration
+	items      map[string]*list.Element
+	lruList    *list.List
+	expiryList *list.List // LRU elements by ExpiresAt; fixed TTL means write order is expiry order
+	mu         sync.RWMutex
+	hits       int64
+	misses     int64
+	evictions  int64
+	recent     hitWindow
+}
+
+// hitWindowSize is the number of most recent lookups RecentHitRate covers
+const hitWindowSize = 1024
+
+// hitWindow is a ring buffer of recent lookup outcomes with a running hit count
+type hitWindow struct {
+	outcomes [hitWindowSize]bool
+	pos      int
+	count    int
+	hits     int
+}
+
+// record adds a lookup outcome, overwriting the oldest once the window is full
+func (w *hitWindow) record(hit bool) {
+	if w.count == hitWindowSize {
+		if w.outcomes[w.pos] {
+			w.hits--
+		}
+	} else {
+		w.count++
+	}
+	w.outcomes[w.pos] = hit
+	if hit {
+		w.hits++
+	}
+	w.pos = (w.pos + 1) % hitWindowSize
 }
 
 // NewSmartCache creates a new cache with LRU eviction and TTL
 func NewSmartCache(maxSize int, ttl time.Duration) *SmartCache {
 	return &SmartCache{
-		maxSize: maxSize,
-		ttl:     ttl,
-		items:   make(map[string]*list.Element),
-		lruList: list.New(),
+		maxSize:    maxSize,
+		ttl:        ttl,
+		items:      make(map[string]*list.Element),
+		lruList:    list.New(),
+		expiryList: list.New(),
 	}
 }
 
@@ -49,6 +90,7 @@ func (c *SmartCache) Get(key string) (interface{}, bool) {
 	elem, exists := c.items[key]
 	if !exists {
 		c.misses++
+		c.recent.record(false)
 		return nil, false
 	}
 
@@ -56,15 +98,16 @@ func (c *SmartCache) Get(key string) (interface{}, bool) {
 
 	// Check if expired
 	if entry.IsExpired() {
-		c.removeLocked(key)
+		c.removeElementLocked(elem)
 		c.misses++
+		c.recent.record(false)
 		return nil, false
 	}
 
-	// Update access time and move to front (most recently used)
-	entry.accessTime = time.Now()
+	// Move to front (most recently used); list order is the only recency record
 	c.lruList.MoveToFront(elem)
 	c.hits++
+	c.recent.record(true)
 
 	return entry.Value, true
 }
@@ -74,10 +117,9 @@ func (c *SmartCache) Set(key string, value interface{}) {
 	c.mu.Lock()
 	defer c.mu.Unlock()
 
-	now := time.Now()
-	expiresAt := time.Time{}
+	var expiresAt time.Time
 	if c.ttl > 0 {
-		expiresAt = now.Add(c.ttl)
+		expiresAt = time.Now().Add(c.ttl)
 	}
 
 	// Check if key already exists
@@ -85,22 +127,26 @@ func (c *SmartCache) Set(key string, value interface{}) {
 		entry := elem.Value.(*CacheEntry)
 		entry.Value = value
 		entry.ExpiresAt = expiresAt
-		entry.accessTime = now
 		c.lruList.MoveToFront(elem)
+		if entry.expiryElem != nil {
+			c.expiryList.MoveToBack(entry.expiryElem)
+		}
 		return
 	}
 
 	// Create new entry
 	entry := &CacheEntry{
-		Key:        key,
-		Value:      value,
-		ExpiresAt:  expiresAt,
-		accessTime: now,
+		Key:       key,
+		Value:     value,
+		ExpiresAt: expiresAt,
 	}
 
 	// Add to front of LRU list
 	elem := c.lruList.PushFront(entry)
 	c.items[key] = elem
+	if c.ttl > 0 {
+		entry.expiryElem = c.expiryList.PushBack(elem)
+	}
 
 	// Evict if over capacity
 	if c.lruList.Len() > c.maxSize {
@@ -122,8 +168,10 @@ func (c *SmartCache) Clear() {
 
 	c.items = make(map[string]*list.Element)
 	c.lruList.Init()
+	c.expiryList.Init()
 	c.hits = 0
 	c.misses = 0
+	c.recent = hitWindow{}
 	c.evictions = 0
 }
 
@@ -153,18 +201,34 @@ func (c *SmartCache) HitRate() float64 {
 	return float64(c.hits) / float64(total)
 }
 
+// RecentHitRate returns the hit rate (0.0 to 1.0) over the last hitWindowSize lookups,
+// so it tracks current behaviour rather than the lifetime average
+func (c *SmartCache) RecentHitRate() float64 {
+	c.mu.RLock()
+	defer c.mu.RUnlock()
+
+	if c.recent.count == 0 {
+		return 0.0
+	}
+	return float64(c.recent.hits) / float64(c.recent.count)
+}
+
 // CleanupExpired removes all expired entries
 func (c *SmartCache) CleanupExpired() int {
 	c.mu.Lock()
 	defer c.mu.Unlock()
 
+	// Read the clock once for the whole pass; expired entries sit at the
+	// front of expiryList, so stop at the first one still alive
+	now := time.Now()
 	removed := 0
-	for key, elem := range c.items {
-		entry := elem.Value.(*CacheEntry)
-		if entry.IsExpired() {
-			c.removeLocked(key)
-			removed++
+	for front := c.expiryList.Front(); front != nil; front = c.expiryList.Front() {
+		elem := front.Value.(*list.Element)
+		if !elem.Value.(*CacheEntry).expiredAt(now) {
+			break
 		}
+		c.removeElementLocked(elem)
+		removed++
 	}
 	return removed
 }
@@ -172,30 +236,68 @@ func (c *SmartCache) CleanupExpired() int {
 // removeLocked removes an entry (must be called with lock held)
 func (c *SmartCache) removeLocked(key string) {
 	if elem, exists := c.items[key]; exists {
-		c.lruList.Remove(elem)
-		delete(c.items, key)
+		c.removeElementLocked(elem)
 	}
 }
 
+// removeElementLocked removes an entry by its list element (must be called with lock held)
+func (c *SmartCache) removeElementLocked(elem *list.Element) {
+	entry := elem.Value.(*CacheEntry)
+	if entry.expiryElem != nil {
+		c.expiryList.Remove(entry.expiryElem)
+	}
+	c.lruList.Remove(elem)
+	delete(c.items, entry.Key)
+}
+
 // evictOldestLocked removes the least recently used entry (must be called with lock held)
 func (c *SmartCache) evictOldestLocked() {
 	elem := c.lruList.Back()
 	if elem != nil {
-		entry := elem.Value.(*CacheEntry)
-		c.removeLocked(entry.Key)
+		c.removeElementLocked(elem)
 		c.evictions++
 	}
 }
 
-// StartCleanupWorker starts a background worker that periodically removes expired entries
+// minCleanupDelay keeps entries expiring close together in a single cleanup pass
+const minCleanupDelay = time.Second
+
+// NextCleanupIn returns how long to wait before the next cleanup pass: until the
+// earliest entry expires, capped at maxInterval and floored at minCleanupDelay
+func (c *SmartCache) NextCleanupIn(maxInterval time.Duration) time.Duration {
+	c.mu.RLock()
+	front := c.expiryList.Front()
+	var expiresAt time.Time
+	if front != nil {
+		expiresAt = front.Value.(*list.Element).Value.(*CacheEntry).ExpiresAt
+	}
+	c.mu.RUnlock()
+
+	if front == nil {
+		return maxInterval
+	}
+
+	delay := time.Until(expiresAt)
+	if delay > maxInterval {
+		return maxInterval
+	}
+	if delay < minCleanupDelay {
+		return minCleanupDelay
+	}
+	return delay
+}
+
+// StartCleanupWorker starts a background worker that removes expired entries,
+// waking when the earliest entry expires but at least once per interval
 func (c *SmartCache) StartCleanupWorker(interval time.Duration, stop <-chan struct{}) {
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
+	timer := time.NewTimer(c.NextCleanupIn(interval))
+	defer timer.Stop()
 
 	for {
 		select {
-		case <-ticker.C:
+		case <-timer.C:
 			c.CleanupExpired()
+			timer.Reset(c.NextCleanupIn(interval))
 		case <-stop:
 			return
 		}
@@ -1,6 +1,7 @@
 package utils
 
 import (
+	"strconv"
 	"testing"
 	"time"
 )
@@ -178,6 +179,30 @@ func TestSmartCacheHitRate(t *testing.T) {
 	}
 }
 
+func TestSmartCacheRecentHitRate(t *testing.T) {
+	cache := NewSmartCache(10, 0)
+	cache.Set("key1", "value1")
+
+	if rate := cache.RecentHitRate(); rate != 0.0 {
+		t.Errorf("Expected 0 before any lookups, got %f", rate)
+	}
+
+	// A full window of misses followed by a full window of hits
+	for i := 0; i < hitWindowSize; i++ {
+		cache.Get("missing")
+	}
+	for i := 0; i < hitWindowSize; i++ {
+		cache.Get("key1")
+	}
+
+	if rate := cache.RecentHitRate(); rate != 1.0 {
+		t.Errorf("Expected recent hit rate 1.0, got %f", rate)
+	}
+	if rate := cache.HitRate(); rate != 0.5 {
+		t.Errorf("Expected lifetime hit rate 0.5, got %f", rate)
+	}
+}
+
 func TestSmartCacheCleanupExpired(t *testing.T) {
 	cache := NewSmartCache(10, 50*time.Millisecond)
 
@@ -198,6 +223,61 @@ func TestSmartCacheCleanupExpired(t *testing.T) {
 	}
 }
 
+func TestSmartCacheCleanupExpiredKeepsRefreshed(t *testing.T) {
+	cache := NewSmartCache(10, 50*time.Millisecond)
+
+	cache.Set("key1", "value1")
+	cache.Set("key2", "value2")
+
+	time.Sleep(30 * time.Millisecond)
+	cache.Set("key1", "updated") // Refresh expiry of key1
+
+	time.Sleep(30 * time.Millisecond)
+
+	removed := cache.CleanupExpired()
+	if removed != 1 {
+		t.Errorf("Expected 1 expired entry, got %d", removed)
+	}
+
+	if val, ok := cache.Get("key1"); !ok || val != "updated" {
+		t.Errorf("Expected refreshed key1 to survive cleanup, got %v", val)
+	}
+}
+
+func TestSmartCacheNextCleanupIn(t *testing.T) {
+	tests := []struct {
+		name     string
+		ttl      time.Duration
+		entries  int
+		maxDelay time.Duration
+		expected time.Duration
+	}{
+		{"Empty cache waits the full interval", time.Hour, 0, time.Minute, time.Minute},
+		{"No TTL waits the full interval", 0, 1, time.Minute, time.Minute},
+		{"Long TTL is capped at the interval", time.Hour, 1, time.Minute, time.Minute},
+		{"Short TTL is floored", 10 * time.Millisecond, 1, time.Minute, minCleanupDelay},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			cache := NewSmartCache(10, tt.ttl)
+			for i := 0; i < tt.entries; i++ {
+				cache.Set("key"+strconv.Itoa(i), i)
+			}
+
+			if got := cache.NextCleanupIn(tt.maxDelay); got != tt.expected {
+				t.Errorf("Expected %v, got %v", tt.expected, got)
+			}
+		})
+	}
+
+	cache := NewSmartCache(10, 30*time.Second)
+	cache.Set("key1", "value1")
+	if got := cache.NextCleanupIn(time.Minute); got <= 29*time.Second || got > 30*time.Second {
+		t.Errorf("Expected delay until first expiry, got %v", got)
+	}
+}
+
 func TestSmartCacheConcurrency(t *testing.T) {
 	cache := NewSmartCache(100, 0)
 	done := make(chan bool)
@@ -246,3 +326,62 @@ func TestSmartCacheEvictionStats(t *testing.T) {
 		t.Errorf("Expected 1 eviction, got %d", evictions)
 	}
 }
+
+func BenchmarkSmartCacheGet(b *testing.B) {
+	cache := NewSmartCache(500, 5*time.Minute)
+	keys := make([]string, 500)
+	for i := range keys {
+		keys[i] = "key" + strconv.Itoa(i)
+		cache.Set(keys[i], i)
+	}
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		cache.Get(keys[i%len(keys)])
+	}
+}
+
+// BenchmarkSmartCacheGetMostRecent repeats a lookup of the most recently used key.
+// list.MoveToFront already returns early when the element is at the front,
+// so this path needs no extra check in Get.
+func BenchmarkSmartCacheGetMostRecent(b *testing.B) {
+	cache := NewSmartCache(500, 5*time.Minute)
+	for i := 0; i < 500; i++ {
+		cache.Set("key"+strconv.Itoa(i), i)
+	}
+	cache.Get("key0")
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		cache.Get("key0")
+	}
+}
+
+func BenchmarkSmartCacheSet(b *testing.B) {
+	cache := NewSmartCache(500, 5*time.Minute)
+	keys := make([]string, 1000)
+	for i := range keys {
+		keys[i] = "key" + strconv.Itoa(i)
+	}
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		cache.Set(keys[i%len(keys)], i)
+	}
+}
+
+func BenchmarkSmartCacheCleanupExpired(b *testing.B) {
+	cache := NewSmartCache(500, 5*time.Minute)
+	for i := 0; i < 500; i++ {
+		cache.Set("key"+strconv.Itoa(i), i)
+	}
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		cache.CleanupExpired()
+	}
+}
@@ -9,13 +9,28 @@ import (
 	"github.com/vuongmanhnghia/discord-music-bot/internal/errors"
 )
 
+// URL pattern sources, shared by the per-platform patterns and supportedPattern
+const (
+	youtubeExpr    = `(https?://)?(www\.)?(youtube\.com|youtu\.be)/.+`
+	soundcloudExpr = `https?://(www\.)?soundcloud\.com/.+`
+	spotifyExpr    = `https?://open\.spotify\.com/(track|album|playlist)/.+`
+)
+
 var (
 	// URL patterns
-	youtubePattern    = regexp.MustCompile(`^(https?://)?(www\.)?(youtube\.com|youtu\.be)/.+$`)
-	soundcloudPattern = regexp.MustCompile(`^https?://(www\.)?soundcloud\.com/.+$`)
-	spotifyPattern    = regexp.MustCompile(`^https?://open\.spotify\.com/(track|album|playlist)/.+$`)
+	youtubePattern    = regexp.MustCompile(`^` + youtubeExpr + `$`)
+	soundcloudPattern = regexp.MustCompile(`^` + soundcloudExpr + `$`)
+	spotifyPattern    = regexp.MustCompile(`^` + spotifyExpr + `$`)
+	// supportedPattern matches any supported platform in a single pass
+	supportedPattern = regexp.MustCompile(`^(?:` + youtubeExpr + `|` + soundcloudExpr + `|` + spotifyExpr + `)$`)
+
+	// Playlist names allow only alphanumerics, spaces, hyphens and underscores
+	playlistNamePattern = regexp.MustCompile(`^[a-zA-Z0-9\s\-_]+$`)
 )
 
+// maxPlaylistNameLength is the longest playlist name accepted, in bytes
+const maxPlaylistNameLength = 100
+
 // ValidateURL validates if a string is a valid URL
 func ValidateURL(input string) error {
 	if input == "" {
@@ -47,21 +62,20 @@ func IsSpotifyURL(input string) bool {
 
 // IsSupportedURL checks if URL is from a supported platform
 func IsSupportedURL(input string) bool {
-	return IsYouTubeURL(input) || IsSoundCloudURL(input) || IsSpotifyURL(input)
+	return supportedPattern.MatchString(input)
 }
 
 // IsYouTubePlaylistURL checks if URL is an actual YouTube playlist URL
 // Returns true only for /playlist?list=... URLs
 // Returns false for video URLs with list parameter like /watch?v=...&list=...
 func IsYouTubePlaylistURL(input string) bool {
-	if !IsYouTubeURL(input) {
-		return false
-	}
 	// Only match actual playlist URLs, not video URLs with list parameter
 	// Playlist URLs have the format: youtube.com/playlist?list=...
 	// Video URLs with list are: youtube.com/watch?v=...&list=... (which we want to ignore)
-	return strings.Contains(input, "/playlist?list=") ||
-		(strings.Contains(input, "/playlist") && strings.Contains(input, "list="))
+	// The substring checks reject most input before the regex has to run
+	return strings.Contains(input, "list=") &&
+		strings.Contains(input, "/playlist") &&
+		IsYouTubeURL(input)
 }
 
 // ValidateVolume validates volume level (0-100)
@@ -99,13 +113,12 @@ func ValidatePlaylistName(name string) error {
 		return fmt.Errorf("%w: playlist name cannot be empty", errors.ErrInvalidInput)
 	}
 
-	if len(name) > 100 {
-		return fmt.Errorf("%w: playlist name too long (max 100 characters)", errors.ErrInvalidInput)
+	if len(name) > maxPlaylistNameLength {
+		return fmt.Errorf("%w: playlist name too long (max %d characters)", errors.ErrInvalidInput, maxPlaylistNameLength)
 	}
 
-	// Check for invalid characters (only allow alphanumeric, spaces, hyphens, underscores)
-	validName := regexp.MustCompile(`^[a-zA-Z0-9\s\-_]+$`)
-	if !validName.MatchString(name) {
+	// Check for invalid characters
+	if !playlistNamePattern.MatchString(name) {
 		return fmt.Errorf("%w: playlist name contains invalid characters", errors.ErrInvalidInput)
 	}
 
@@ -1,6 +1,9 @@
 package validation
 
-import "testing"
+import (
+	"strings"
+	"testing"
+)
 
 func TestIsYouTubePlaylistURL(t *testing.T) {
 	tests := []struct {
@@ -59,3 +62,50 @@ func TestIsYouTubePlaylistURL(t *testing.T) {
 		})
 	}
 }
+
+func TestValidatePlaylistName(t *testing.T) {
+	tests := []struct {
+		name    string
+		input   string
+		wantErr bool
+	}{
+		{"Simple name", "My Mix_2024-01", false},
+		{"Surrounding whitespace trimmed", "  chill  ", false},
+		{"Empty", "   ", true},
+		{"Too long", strings.Repeat("a", maxPlaylistNameLength+1), true},
+		{"Invalid characters", "mix/../etc", true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			err := ValidatePlaylistName(tt.input)
+			if (err != nil) != tt.wantErr {
+				t.Errorf("ValidatePlaylistName(%q) error = %v, wantErr %v", tt.input, err, tt.wantErr)
+			}
+		})
+	}
+}
+
+func TestIsSupportedURL(t *testing.T) {
+	tests := []struct {
+		name     string
+		url      string
+		expected bool
+	}{
+		{"YouTube video", "https://www.youtube.com/watch?v=dQw4w9WgXcQ", true},
+		{"YouTube short link without scheme", "youtu.be/dQw4w9WgXcQ", true},
+		{"SoundCloud track", "https://soundcloud.com/artist/track", true},
+		{"Spotify album", "https://open.spotify.com/album/1DFixLWuPkv3KT3TnV35m3", true},
+		{"Spotify artist", "https://open.spotify.com/artist/0OdUWJ0sBjDrqHygGUXeCF", false},
+		{"Other site", "https://example.com/song.mp3", false},
+		{"Search query", "never gonna give you up", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := IsSupportedURL(tt.url); got != tt.expected {
+				t.Errorf("IsSupportedURL(%s) = %v, expected %v", tt.url, got, tt.expected)
+			}
+		})
+	}
+}
@@ -67,3 +67,9 @@ func (l *Logger) WithFields(fields logrus.Fields) *logrus.Entry {
 func (l *Logger) WithError(err error) *logrus.Entry {
 	return l.Logger.WithError(err)
 }
+
+// DebugEnabled reports whether debug entries are emitted, so callers can skip
+// building fields for debug logs that would be dropped
+func (l *Logger) DebugEnabled() bool {
+	return l.IsLevelEnabled(logrus.DebugLevel)
+}